@@ -36,7 +36,7 @@ from src.config.llm_config import LLMConfig, LLMProvider
 from src.agents.async_agents import AsyncAgentFactory, run_development_workflow_async
 from src.monitoring.logger import AICrewLogger
 from src.utils.environment import validate_environment
-from src.utils.context7_integration import context7
+from src.utils.context7_integration import get_context7
 
 class ApplicationType(Enum):
     """Supported application types"""
@@ -312,7 +312,7 @@ Please provide:
 """
         
         # Use Context7 integration to enhance the prompt
-        enhanced_prompt = context7.enhance_prompt_with_context7(base_prompt, requirements.technologies)
+        enhanced_prompt = get_context7().enhance_prompt_with_context7(base_prompt, requirements.technologies)
         return enhanced_prompt
 
 class AICrewDevCLI:
@@ -64,14 +64,17 @@ class AsyncAgentFactory:
     Asynchronous agent factory for concurrent agent creation and management
     """
 
-    def __init__(self, max_workers: int = 4):
+    def __init__(self, max_workers: int = 4, inline_threshold: int = 0):
         """
         Initialize async agent factory
         
         Args:
             max_workers: Maximum number of concurrent operations
+            inline_threshold: Batches of at most this many agents are created
+                on the calling thread instead of the pool (0 disables)
         """
         self.max_workers = max_workers
+        self.inline_threshold = inline_threshold
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
         self.active_operations: Dict[str, AsyncOperationResult] = {}
         self.operation_counter = 0
@@ -88,6 +91,7 @@ class AsyncAgentFactory:
         goal: str,
         backstory: str,
         tools: Optional[List[Any]] = None,
+        inline: bool = False,
         **kwargs
     ) -> AsyncOperationResult:
         """
@@ -99,6 +103,7 @@ class AsyncAgentFactory:
             goal: Agent goal
             backstory: Agent backstory
             tools: Optional tools list
+            inline: Create the agent on the calling thread, skipping the pool
             **kwargs: Additional agent parameters
             
         Returns:
@@ -120,13 +125,16 @@ class AsyncAgentFactory:
         try:
             operation.status = AsyncOperationStatus.RUNNING
             
-            # Run agent creation in thread pool
-            loop = asyncio.get_event_loop()
-            agent = await loop.run_in_executor(
-                self.executor,
-                self._create_agent_sync,
-                config, role, goal, backstory, tools, kwargs
-            )
+            if inline:
+                agent = self._create_agent_sync(config, role, goal, backstory, tools, kwargs)
+            else:
+                # Run agent creation in thread pool
+                loop = asyncio.get_event_loop()
+                agent = await loop.run_in_executor(
+                    self.executor,
+                    self._create_agent_sync,
+                    config, role, goal, backstory, tools, kwargs
+                )
             
             operation.result = agent
             operation.status = AsyncOperationStatus.COMPLETED
@@ -205,6 +213,9 @@ class AsyncAgentFactory:
             except Exception as e:
                 raise ValidationError(f"Invalid agent configuration: {e}")
 
+        # Small batches skip the thread-pool round trips entirely
+        inline = len(validated_configs) <= self.inline_threshold
+
         # Create agents concurrently
         tasks = []
         for agent_config in validated_configs:
@@ -213,13 +224,18 @@ class AsyncAgentFactory:
                 role=agent_config["role"],
                 goal=agent_config["goal"],
                 backstory=agent_config["backstory"],
+                inline=inline,
                 allow_delegation=agent_config.get("allow_delegation", False),
                 allow_code_execution=agent_config.get("allow_code_execution", False),
                 verbose=agent_config.get("verbose", True)
             )
             tasks.append(task)
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        if inline:
+            # create_agent_async records failures on the result rather than raising
+            results = [await task for task in tasks]
+        else:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Handle any exceptions
         operations = []
@@ -713,7 +729,8 @@ async def run_development_workflow_async(
     project_type: str,
     llm_config: LLMConfig,
     team_size: str = "standard",
-    custom_tasks: Optional[List[str]] = None
+    custom_tasks: Optional[List[str]] = None,
+    agent_factory: Optional[AsyncAgentFactory] = None
 ) -> AsyncOperationResult:
     """
     Utility function to run a complete development workflow asynchronously
@@ -723,11 +740,13 @@ async def run_development_workflow_async(
         llm_config: LLM configuration
         team_size: Size of development team
         custom_tasks: Optional custom task descriptions
+        agent_factory: Existing factory to reuse; it is left running. If None,
+            a temporary factory is created and shut down afterwards.
         
     Returns:
         AsyncOperationResult with workflow results
     """
-    factory = AsyncAgentFactory()
+    factory = agent_factory or AsyncAgentFactory()
     manager = AsyncCrewManager(factory)
     
     try:
@@ -739,7 +758,8 @@ async def run_development_workflow_async(
         )
         return result
     finally:
-        await factory.shutdown()
+        if agent_factory is None:
+            await factory.shutdown()
 
 
 # Export main classes and functions
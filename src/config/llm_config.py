@@ -7,7 +7,8 @@ using CrewAI best practices. Updated based on latest Context7 documentation.
 """
 
 from enum import Enum
-from typing import Dict, Optional, Any, Union
+from functools import lru_cache
+from typing import Dict, Optional, Any, Tuple, Union
 import os
 from pydantic import BaseModel, Field
 
@@ -27,6 +28,17 @@ class LLMProvider(str, Enum):
     OPENAI = "openai"
     ANTHROPIC = "anthropic"
 
+# Environment variables read by LLMConfig.get_default_config
+_DEFAULT_CONFIG_ENV_VARS = (
+    "LLM_PROVIDER",
+    "LLM_MODEL_NAME",
+    "LLM_TEMPERATURE",
+    "LLM_MAX_TOKENS",
+    "OPENAI_API_KEY",
+    "ANTHROPIC_API_KEY",
+    "LLM_VERBOSE",
+)
+
 class LLMConfig(BaseModel):
     """
     Configuration class for LLM settings with CrewAI integration.
@@ -54,11 +66,28 @@ class LLMConfig(BaseModel):
         """
         Get default configuration from environment variables.
         
+        Configurations are cached per distinct set of relevant environment
+        values; each call returns a fresh copy.
+        
         Returns:
             LLMConfig: Configuration instance with environment-based values
         """
+        env_values = tuple(os.environ.get(key) for key in _DEFAULT_CONFIG_ENV_VARS)
+        return cls._config_for_env(env_values).model_copy()
+
+    @classmethod
+    @lru_cache(maxsize=8)
+    def _config_for_env(cls, env_values: Tuple[Optional[str], ...]) -> "LLMConfig":
+        """Build the default configuration for a snapshot of the environment."""
+        env = dict(zip(_DEFAULT_CONFIG_ENV_VARS, env_values))
+        
+        def getenv(key: str, default: Optional[str] = None) -> Optional[str]:
+            # Same semantics as os.getenv: only unset variables take the default
+            value = env[key]
+            return default if value is None else value
+        
         # Get provider from environment with fallback
-        provider_str = os.getenv("LLM_PROVIDER", "openai").lower()
+        provider_str = getenv("LLM_PROVIDER", "openai").lower()
         try:
             provider = LLMProvider(provider_str)
         except ValueError:
@@ -72,18 +101,18 @@ class LLMConfig(BaseModel):
             LLMProvider.OLLAMA: "llama3.1:8b"
         }
         
-        model_name = os.getenv("LLM_MODEL_NAME", model_defaults[provider])
+        model_name = getenv("LLM_MODEL_NAME", model_defaults[provider])
         
         # Parse temperature with bounds checking
         try:
-            temperature = float(os.getenv("LLM_TEMPERATURE", "0.7"))
+            temperature = float(getenv("LLM_TEMPERATURE", "0.7"))
             temperature = max(0.0, min(2.0, temperature))  # Clamp between 0 and 2
         except (ValueError, TypeError):
             temperature = 0.7
 
         # Parse max_tokens
         max_tokens = None
-        max_tokens_str = os.getenv("LLM_MAX_TOKENS")
+        max_tokens_str = getenv("LLM_MAX_TOKENS")
         if max_tokens_str:
             try:
                 max_tokens = int(max_tokens_str)
@@ -93,12 +122,12 @@ class LLMConfig(BaseModel):
         # Get API keys from environment
         api_key = None
         if provider == LLMProvider.OPENAI:
-            api_key = os.getenv("OPENAI_API_KEY")
+            api_key = getenv("OPENAI_API_KEY")
         elif provider == LLMProvider.ANTHROPIC:
-            api_key = os.getenv("ANTHROPIC_API_KEY")
+            api_key = getenv("ANTHROPIC_API_KEY")
 
         # Parse other parameters
-        verbose = os.getenv("LLM_VERBOSE", "true").lower() == "true"
+        verbose = getenv("LLM_VERBOSE", "true").lower() == "true"
         
         return cls(
             provider=provider,
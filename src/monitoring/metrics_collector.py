@@ -5,15 +5,26 @@ Tracks performance metrics, usage statistics, and system health indicators
 for monitoring and optimization purposes.
 """
 
+import sys
 import time
+from array import array
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Union
-from collections import defaultdict, deque
-from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple, Union
+from collections import Counter, defaultdict, deque
+from dataclasses import dataclass
 from enum import Enum
 import threading
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Upper bound on pooled tag combinations so high-cardinality IDs cannot grow it unbounded
+_TAG_POOL_LIMIT = 4096
+
 class MetricType(Enum):
     """Types of metrics we can collect."""
     COUNTER = "counter"
@@ -28,9 +39,61 @@ class MetricPoint:
     value: Union[int, float]
     metric_type: MetricType
     timestamp: datetime
-    tags: Dict[str, str] = field(default_factory=dict)
+    tags: Tuple[Tuple[str, str], ...] = ()
     unit: str = ""
 
+class TimeSeriesBuffer:
+    """
+    Fixed-capacity ring buffer of (timestamp, value) samples.
+    
+    Timestamps (epoch nanoseconds) and values are stored in parallel
+    typed arrays instead of one dict per sample.
+    """
+    
+    __slots__ = ("capacity", "timestamps", "values", "_head", "_size")
+    
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self.timestamps = array('q', bytes(8 * capacity))
+        self.values = array('d', bytes(8 * capacity))
+        self._head = 0
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def append(self, timestamp_ns: int, value: float):
+        """Add a sample, overwriting the oldest one when full."""
+        self.timestamps[self._head] = timestamp_ns
+        self.values[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+    
+    def drop_older_than(self, cutoff_ns: int):
+        """Discard samples with a timestamp before the cutoff."""
+        start = (self._head - self._size) % self.capacity
+        while self._size and self.timestamps[start] < cutoff_ns:
+            start = (start + 1) % self.capacity
+            self._size -= 1
+    
+    def clear(self):
+        """Drop all samples."""
+        self._head = 0
+        self._size = 0
+    
+    def snapshot(self) -> Tuple[List[int], List[float]]:
+        """Return (timestamps, values) ordered from oldest to newest."""
+        start = (self._head - self._size) % self.capacity
+        end = start + self._size
+        if end <= self.capacity:
+            return self.timestamps[start:end].tolist(), self.values[start:end].tolist()
+        wrap = end - self.capacity
+        return (
+            self.timestamps[start:].tolist() + self.timestamps[:wrap].tolist(),
+            self.values[start:].tolist() + self.values[:wrap].tolist(),
+        )
+
 @dataclass
 class PerformanceStats:
     """Performance statistics for an operation."""
@@ -44,6 +107,26 @@ class PerformanceStats:
     error_count: int = 0
     success_rate: float = 0.0
     last_execution: Optional[datetime] = None
+    
+    def __post_init__(self):
+        # Per-operation update lock; kept out of the dataclass fields so it is
+        # neither an __init__ argument nor seen by asdict()/copying
+        self._lock = threading.Lock()
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state.pop("_lock", None)
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+    
+    def refresh_average(self) -> float:
+        """Recompute the derived average duration (kept out of the update path)."""
+        if self.total_executions:
+            self.avg_duration_ms = self.total_duration_ms / self.total_executions
+        return self.avg_duration_ms
 
 @dataclass
 class LLMUsageStats:
@@ -85,6 +168,9 @@ class MetricsCollector:
         # Thread-safe metrics storage
         self._lock = threading.Lock()
         
+        # Guards only insertion of new operations; updates use per-operation locks
+        self._stats_insert_lock = threading.RLock()
+        
         # Raw metrics storage
         self._metrics: deque = deque(maxlen=max_datapoints)
         
@@ -100,26 +186,56 @@ class MetricsCollector:
         self._gauges: Dict[str, float] = {}
         
         # Time series data for trending
-        self._time_series: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
+        self._time_series: Dict[str, TimeSeriesBuffer] = defaultdict(TimeSeriesBuffer)
         
         # Error tracking
-        self._error_patterns: Dict[str, int] = defaultdict(int)
+        self._error_patterns: Counter = Counter()
+        self._error_key_cache: Dict[Tuple[str, str], str] = {}
+        
+        # Pool of shared tag tuples for recurring tag combinations
+        self._tag_intern: Dict[Tuple[Tuple[str, str], ...], Tuple[Tuple[str, str], ...]] = {}
         
         # Start time for uptime calculation
         self._start_time = datetime.utcnow()
     
+    def _append_metric_locked(self, metric: MetricPoint):
+        """Store a metric point; caller must hold ``self._lock``."""
+        self._metrics.append(metric)
+        
+        # Add to time series
+        series_key = f"{metric.name}_{metric.metric_type.value}"
+        self._time_series[series_key].append(time.time_ns(), metric.value)
+    
+    def _make_tags(self, *pairs: Tuple[str, str]) -> Tuple[Tuple[str, str], ...]:
+        """Build a tag tuple, sharing one instance per recurring combination."""
+        tags = self._tag_intern.get(pairs)
+        if tags is not None:
+            return tags
+        if len(self._tag_intern) < _TAG_POOL_LIMIT:
+            return self._tag_intern.setdefault(pairs, pairs)
+        return pairs
+    
     def _add_metric(self, metric: MetricPoint):
         """Thread-safe metric addition."""
         with self._lock:
-            self._metrics.append(metric)
-            
-            # Add to time series
-            series_key = f"{metric.name}_{metric.metric_type.value}"
-            self._time_series[series_key].append({
-                "timestamp": metric.timestamp,
-                "value": metric.value,
-                "tags": metric.tags
-            })
+            self._append_metric_locked(metric)
+    
+    def _add_metric_with_counter(self, metric: MetricPoint, counter_key: str):
+        """
+        Store a metric point and bump a counter under one lock acquisition.
+        
+        Counters are polled rather than streamed, so no separate metric
+        point is emitted for the counter update.
+        """
+        with self._lock:
+            self._append_metric_locked(metric)
+            self._counters[counter_key] += 1
+    
+    def _bump_counters(self, *names: str):
+        """Increment internal counters without emitting metric points."""
+        with self._lock:
+            for name in names:
+                self._counters[name] += 1
     
     def _cleanup_old_metrics(self):
         """Remove metrics older than retention period."""
@@ -131,9 +247,30 @@ class MetricsCollector:
                 self._metrics.popleft()
             
             # Clean up time series
+            cutoff_ns = time.time_ns() - int(self.retention_hours * 3600 * 1e9)
             for series in self._time_series.values():
-                while series and series[0]["timestamp"] < cutoff_time:
-                    series.popleft()
+                series.drop_older_than(cutoff_ns)
+    
+    def _get_or_create_performance_stats(self, operation: str) -> PerformanceStats:
+        """Get stats for an operation, inserting them on first use."""
+        stats = self._performance_stats.get(operation)
+        if stats is None:
+            with self._stats_insert_lock:
+                stats = self._performance_stats.get(operation)
+                if stats is None:
+                    stats = PerformanceStats(operation)
+                    self._performance_stats[operation] = stats
+        return stats
+    
+    def _record_error_pattern(self, operation: str, error_type: str):
+        """Count an error occurrence, reusing the key built for this pair."""
+        pair = (operation, error_type)
+        key = self._error_key_cache.get(pair)
+        if key is None:
+            key = self._error_key_cache.setdefault(pair, f"{operation}_{error_type}")
+        
+        with self._lock:
+            self._error_patterns[key] += 1
     
     # Performance tracking methods
     def track_operation_start(self, operation: str) -> str:
@@ -146,6 +283,7 @@ class MetricsCollector:
         Returns:
             Unique tracking ID for this operation
         """
+        operation = sys.intern(operation)
         tracking_id = f"{operation}_{int(time.time() * 1000000)}"
         
         metric = MetricPoint(
@@ -153,11 +291,10 @@ class MetricsCollector:
             value=1,
             metric_type=MetricType.COUNTER,
             timestamp=datetime.utcnow(),
-            tags={"operation": operation, "tracking_id": tracking_id}
+            tags=self._make_tags(("operation", operation))
         )
         
-        self._add_metric(metric)
-        self.increment_counter(f"operations_started_{operation}")
+        self._add_metric_with_counter(metric, f"operations_started_{operation}")
         
         return tracking_id
     
@@ -174,38 +311,42 @@ class MetricsCollector:
         
         Args:
             operation: Operation name
-            tracking_id: Tracking ID from start
+            tracking_id: Tracking ID from start (used for correlation only,
+                not emitted as a metric tag to keep tag cardinality bounded)
             duration_ms: Operation duration in milliseconds
             success: Whether operation succeeded
             error_type: Type of error if failed
         """
+        operation = sys.intern(operation)
+        
         # Record timing metric
         metric = MetricPoint(
             name="operation_duration_ms",
             value=duration_ms,
             metric_type=MetricType.TIMER,
             timestamp=datetime.utcnow(),
-            tags={
-                "operation": operation,
-                "tracking_id": tracking_id,
-                "success": str(success),
-                "error_type": error_type or "none"
-            }
+            tags=self._make_tags(
+                ("operation", operation),
+                ("success", "True" if success else "False"),
+                ("error_type", error_type or "none")
+            )
         )
         
-        self._add_metric(metric)
+        counter_key = (
+            f"operations_succeeded_{operation}" if success
+            else f"operations_failed_{operation}"
+        )
+        self._add_metric_with_counter(metric, counter_key)
         
-        # Update performance statistics
-        with self._lock:
-            if operation not in self._performance_stats:
-                self._performance_stats[operation] = PerformanceStats(operation)
-            
-            stats = self._performance_stats[operation]
+        # Update performance statistics under the operation's own lock
+        stats = self._get_or_create_performance_stats(operation)
+        with stats._lock:
             stats.total_executions += 1
             stats.total_duration_ms += duration_ms
-            stats.min_duration_ms = min(stats.min_duration_ms, duration_ms)
-            stats.max_duration_ms = max(stats.max_duration_ms, duration_ms)
-            stats.avg_duration_ms = stats.total_duration_ms / stats.total_executions
+            if duration_ms < stats.min_duration_ms:
+                stats.min_duration_ms = duration_ms
+            if duration_ms > stats.max_duration_ms:
+                stats.max_duration_ms = duration_ms
             stats.last_execution = datetime.utcnow()
             
             if success:
@@ -213,15 +354,9 @@ class MetricsCollector:
             else:
                 stats.error_count += 1
                 if error_type:
-                    self._error_patterns[f"{operation}_{error_type}"] += 1
+                    self._record_error_pattern(operation, error_type)
             
             stats.success_rate = stats.success_count / stats.total_executions
-        
-        # Update counters
-        if success:
-            self.increment_counter(f"operations_succeeded_{operation}")
-        else:
-            self.increment_counter(f"operations_failed_{operation}")
     
     def track_agent_performance(
         self, 
@@ -245,12 +380,14 @@ class MetricsCollector:
             success: Whether task succeeded
             quality_score: Optional quality assessment (0-1)
         """
-        tags = {
-            "agent_id": agent_id,
-            "agent_role": agent_role,
-            "task_type": task_type,
-            "success": str(success)
-        }
+        agent_role = sys.intern(agent_role)
+        task_type = sys.intern(task_type)
+        tags = self._make_tags(
+            ("agent_id", agent_id),
+            ("agent_role", agent_role),
+            ("task_type", task_type),
+            ("success", "True" if success else "False")
+        )
         
         # Duration metric
         self._add_metric(MetricPoint(
@@ -285,11 +422,11 @@ class MetricsCollector:
             ))
         
         # Update counters
-        self.increment_counter(f"agent_tasks_{agent_role}")
-        if success:
-            self.increment_counter(f"agent_tasks_succeeded_{agent_role}")
-        else:
-            self.increment_counter(f"agent_tasks_failed_{agent_role}")
+        self._bump_counters(
+            f"agent_tasks_{agent_role}",
+            f"agent_tasks_succeeded_{agent_role}" if success
+            else f"agent_tasks_failed_{agent_role}"
+        )
     
     def track_llm_usage(
         self, 
@@ -315,13 +452,16 @@ class MetricsCollector:
             success: Whether request succeeded
             error_type: Type of error if failed
         """
-        tags = {
-            "provider": provider,
-            "model": model,
-            "operation": operation,
-            "success": str(success),
-            "error_type": error_type or "none"
-        }
+        provider = sys.intern(provider)
+        model = sys.intern(model)
+        operation = sys.intern(operation)
+        tags = self._make_tags(
+            ("provider", provider),
+            ("model", model),
+            ("operation", operation),
+            ("success", "True" if success else "False"),
+            ("error_type", error_type or "none")
+        )
         
         # Usage metrics
         self._add_metric(MetricPoint(
@@ -392,10 +532,10 @@ class MetricsCollector:
             success: Whether execution succeeded
             result_length: Length of result output
         """
-        tags = {
-            "crew_id": crew_id,
-            "success": str(success)
-        }
+        tags = self._make_tags(
+            ("crew_id", crew_id),
+            ("success", "True" if success else "False")
+        )
         
         # Execution metrics
         self._add_metric(MetricPoint(
@@ -436,11 +576,10 @@ class MetricsCollector:
             ))
         
         # Update counters
-        self.increment_counter("crew_executions_total")
-        if success:
-            self.increment_counter("crew_executions_succeeded")
-        else:
-            self.increment_counter("crew_executions_failed")
+        self._bump_counters(
+            "crew_executions_total",
+            "crew_executions_succeeded" if success else "crew_executions_failed"
+        )
     
     # System metrics
     def track_system_metric(self, name: str, value: Union[int, float], unit: str = ""):
@@ -483,11 +622,18 @@ class MetricsCollector:
     # Data retrieval methods
     def get_performance_stats(self, operation: Optional[str] = None) -> Dict[str, PerformanceStats]:
         """Get performance statistics for operations."""
-        with self._lock:
+        with self._stats_insert_lock:
             if operation:
                 stats = self._performance_stats.get(operation)
-                return {operation: stats} if stats else {}
-            return dict(self._performance_stats)
+                selected = {} if stats is None else {operation: stats}
+            else:
+                selected = dict(self._performance_stats)
+        
+        # Refresh under each operation's own lock, as track_operation_end updates
+        for stats in selected.values():
+            with stats._lock:
+                stats.refresh_average()
+        return selected
     
     def get_llm_usage_stats(self) -> Dict[str, LLMUsageStats]:
         """Get LLM usage statistics."""
@@ -509,6 +655,12 @@ class MetricsCollector:
         with self._lock:
             return dict(self._error_patterns)
     
+    def get_time_series(self, name: str, metric_type: MetricType) -> Tuple[List[int], List[float]]:
+        """Get (timestamps_ns, values) samples recorded for a metric."""
+        with self._lock:
+            series = self._time_series.get(f"{name}_{metric_type.value}")
+            return series.snapshot() if series else ([], [])
+    
     def get_performance_dashboard(self) -> Dict[str, Any]:
         """
         Get comprehensive performance dashboard data.
@@ -518,20 +670,36 @@ class MetricsCollector:
         """
         self._cleanup_old_metrics()
         
+        # Read each operation under its own lock, as track_operation_end updates
+        # it. This happens before taking self._lock because error recording
+        # acquires self._lock while already holding a stats lock.
+        operation_stats = {}
+        total_successes = 0
+        with self._stats_insert_lock:
+            performance_stats = dict(self._performance_stats)
+        for name, stats in performance_stats.items():
+            with stats._lock:
+                operation_stats[name] = {
+                    "executions": stats.total_executions,
+                    "avg_duration_ms": round(stats.refresh_average(), 2),
+                    "success_rate": round(stats.success_rate, 3),
+                    "last_execution": stats.last_execution.isoformat() if stats.last_execution else None
+                }
+                total_successes += stats.success_count
+        
         with self._lock:
             # Calculate uptime
             uptime_seconds = (datetime.utcnow() - self._start_time).total_seconds()
             
             # Top operations by frequency
             top_operations = sorted(
-                [(op, stats.total_executions) for op, stats in self._performance_stats.items()],
+                [(op, op_stats["executions"]) for op, op_stats in operation_stats.items()],
                 key=lambda x: x[1],
                 reverse=True
             )[:10]
             
             # Overall success rate
-            total_successes = sum(stats.success_count for stats in self._performance_stats.values())
-            total_executions = sum(stats.total_executions for stats in self._performance_stats.values())
+            total_executions = sum(op_stats["executions"] for op_stats in operation_stats.values())
             overall_success_rate = total_successes / total_executions if total_executions > 0 else 0
             
             # LLM usage summary
@@ -544,7 +712,7 @@ class MetricsCollector:
                 "uptime_seconds": uptime_seconds,
                 "system": {
                     "metrics_count": len(self._metrics),
-                    "operations_tracked": len(self._performance_stats),
+                    "operations_tracked": len(operation_stats),
                     "system_metrics": dict(self._system_metrics)
                 },
                 "performance": {
@@ -552,15 +720,7 @@ class MetricsCollector:
                     "total_executions": total_executions,
                     "total_successes": total_successes,
                     "top_operations": top_operations,
-                    "operation_stats": {
-                        name: {
-                            "executions": stats.total_executions,
-                            "avg_duration_ms": round(stats.avg_duration_ms, 2),
-                            "success_rate": round(stats.success_rate, 3),
-                            "last_execution": stats.last_execution.isoformat() if stats.last_execution else None
-                        }
-                        for name, stats in self._performance_stats.items()
-                    }
+                    "operation_stats": operation_stats
                 },
                 "llm_usage": {
                     "total_requests": total_llm_requests,
@@ -596,7 +756,14 @@ class MetricsCollector:
             Formatted metrics data
         """
         if format == "json":
-            return json.dumps(self.get_performance_dashboard(), indent=2, default=str)
+            dashboard = self.get_performance_dashboard()
+            if ORJSON_AVAILABLE:
+                return orjson.dumps(
+                    dashboard,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS,
+                    default=str
+                ).decode()
+            return json.dumps(dashboard, indent=2, default=str)
         elif format == "prometheus":
             # Basic Prometheus format
             lines = []
@@ -615,7 +782,7 @@ class MetricsCollector:
     
     def reset_metrics(self):
         """Reset all metrics (useful for testing)."""
-        with self._lock:
+        with self._stats_insert_lock, self._lock:
             self._metrics.clear()
             self._performance_stats.clear()
             self._llm_usage_stats.clear()
@@ -624,6 +791,7 @@ class MetricsCollector:
             self._gauges.clear()
             self._time_series.clear()
             self._error_patterns.clear()
+            self._tag_intern.clear()
             self._start_time = datetime.utcnow()
 
 
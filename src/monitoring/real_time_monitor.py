@@ -7,14 +7,38 @@ for LLM operations, giving users visibility into ongoing processes.
 """
 
 import asyncio
+import functools
+import heapq
+import inspect
+import sys
 import threading
 import time
+import types
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, Callable, List
+from typing import Deque, Dict, Any, Optional, Callable, List, Mapping, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _encode_json(data: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode()
+
+
+def _dumps_json(data: Any) -> str:
+    """Serialize to an indented JSON string"""
+    return _encode_json(data).decode()
+
 class OperationStatus(str, Enum):
     """Status of an ongoing operation"""
     QUEUED = "queued"
@@ -26,6 +50,38 @@ class OperationStatus(str, Enum):
     FAILED = "failed"
     CANCELLED = "cancelled"
 
+# Statuses after which an operation no longer changes
+_TERMINAL_STATUSES = frozenset({
+    OperationStatus.COMPLETED, OperationStatus.FAILED, OperationStatus.CANCELLED
+})
+
+# Default duration estimates (seconds) used before any history exists
+_DEFAULT_DURATION_ESTIMATES = {
+    "llm_chat": 5.0,
+    "llm_completion": 10.0,
+    "llm_generation": 15.0,
+    "crew_execution": 30.0,
+    "agent_task": 8.0
+}
+
+# Console rendering tables, built once at import
+_BAR_LENGTH = 30
+_BAR_CACHE = ['█' * i + '░' * (_BAR_LENGTH - i) for i in range(_BAR_LENGTH + 1)]
+_STATUS_EMOJI = {
+    OperationStatus.QUEUED: "⏳",
+    OperationStatus.INITIALIZING: "🔄",
+    OperationStatus.PROCESSING: "⚙️",
+    OperationStatus.STREAMING: "📡",
+    OperationStatus.FINALIZING: "🔄",
+    OperationStatus.COMPLETED: "✅",
+    OperationStatus.FAILED: "❌",
+    OperationStatus.CANCELLED: "⏹️"
+}
+_LINE_FMT = "\r{emoji} [{bar}] {pct:5.1f}% | {step}{rem}{tps}"
+_ETA_SECONDS_FMT = " (ETA: {:.1f}s)"
+_ETA_MINUTES_FMT = " (ETA: {}m {}s)"
+_TPS_FMT = " | {:.1f} tok/s"
+
 @dataclass
 class ProgressUpdate:
     """Real-time progress update for an operation"""
@@ -50,22 +106,26 @@ class LiveOperation:
     current_step: str = "Initializing..."
     estimated_duration_seconds: Optional[float] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    start_monotonic: float = field(default_factory=time.monotonic)
     
-    def elapsed_seconds(self) -> float:
-        """Get elapsed time in seconds"""
-        return (datetime.now() - self.start_time).total_seconds()
+    def elapsed_seconds(self, now: Optional[float] = None) -> float:
+        """Get elapsed time in seconds (``now`` is a time.monotonic() value)"""
+        if now is None:
+            now = time.monotonic()
+        return now - self.start_monotonic
     
-    def estimated_remaining_seconds(self) -> Optional[float]:
-        """Calculate estimated remaining time"""
-        if self.progress_percent <= 0 or self.estimated_duration_seconds is None:
+    def estimated_remaining_seconds(self, now: Optional[float] = None,
+                                    elapsed: Optional[float] = None) -> Optional[float]:
+        """Calculate estimated remaining time (pass ``elapsed`` if already known)"""
+        if self.estimated_duration_seconds is None or self.progress_percent <= 0:
             return None
-        
-        elapsed = self.elapsed_seconds()
         if self.progress_percent >= 100:
             return 0.0
         
-        estimated_total = elapsed / (self.progress_percent / 100)
-        return max(0, estimated_total - elapsed)
+        if elapsed is None:
+            elapsed = self.elapsed_seconds(now)
+        # elapsed / (p / 100) - elapsed, with one divide
+        return max(0.0, elapsed * (100.0 / self.progress_percent - 1.0))
 
 class RealTimeMonitor:
     """
@@ -73,34 +133,73 @@ class RealTimeMonitor:
     and providing progress updates to users.
     """
     
-    def __init__(self, update_interval_seconds: float = 0.5):
+    def __init__(self, update_interval_seconds: float = 0.5,
+                 eta_refresh_seconds: float = 2.0):
         self.update_interval = update_interval_seconds
+        self.eta_refresh_interval = eta_refresh_seconds
         self.active_operations: Dict[str, LiveOperation] = {}
-        self.progress_callbacks: List[Callable[[ProgressUpdate], None]] = []
+        # Replaced wholesale on registration so readers iterate a stable snapshot
+        self._callbacks: Tuple[Callable[[ProgressUpdate], Any], ...] = ()
         self.is_monitoring = False
         self.monitor_thread: Optional[threading.Thread] = None
         self._lock = threading.Lock()
         
-        # Historical data for estimation
-        self.operation_history: Dict[str, List[float]] = {}
+        # Event loop hosted by the monitor thread; updates mark operations
+        # dirty and wake it instead of the loop polling every operation
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._dirty: Set[str] = set()
+        self._generation = 0
+        
+        # Read-only view of active_operations, rebuilt only when the
+        # generation has moved since it was taken
+        self._snapshot: Mapping[str, LiveOperation] = types.MappingProxyType({})
+        self._snapshot_generation = 0
         
-    def add_progress_callback(self, callback: Callable[[ProgressUpdate], None]):
-        """Add a callback to receive progress updates"""
-        self.progress_callbacks.append(callback)
+        # Finished operations awaiting removal, as a (deadline, id) min-heap
+        # drained by the monitor loop instead of one Timer thread each
+        self.completed_retention_seconds = 5.0
+        self._pending_removal: List[Tuple[float, str]] = []
+        
+        # Last emitted (status, progress, step, tokens, eta) per operation
+        self._last_emit: Dict[str, tuple] = {}
+        
+        # Historical data for estimation (recent durations plus running sums)
+        self.operation_history: Dict[str, Deque[float]] = {}
+        self._history_sum: Dict[str, float] = {}
+        # Per-type duration estimates, refreshed when history changes
+        self._duration_cache: Dict[str, Optional[float]] = {}
+        
+    def add_progress_callback(self, callback: Callable[[ProgressUpdate], Any]):
+        """Add a callback (sync or coroutine function) to receive progress updates"""
+        with self._lock:
+            self._callbacks = self._callbacks + (callback,)
+    
+    @property
+    def progress_callbacks(self) -> Tuple[Callable[[ProgressUpdate], Any], ...]:
+        """Registered progress callbacks"""
+        return self._callbacks
     
     def start_monitoring(self):
-        """Start the real-time monitoring thread"""
+        """Start the real-time monitoring thread and its event loop"""
         if not self.is_monitoring:
             self.is_monitoring = True
-            self.monitor_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
+            self._loop = asyncio.new_event_loop()
+            self.monitor_thread = threading.Thread(target=self._run_event_loop, daemon=True)
             self.monitor_thread.start()
     
     def stop_monitoring(self):
         """Stop the real-time monitoring thread"""
         self.is_monitoring = False
+        self._signal_wake()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=2.0)
     
+    @property
+    def generation(self) -> int:
+        """Counter bumped whenever tracked operation state changes"""
+        return self._generation
+    
     def start_operation(self, operation_id: str, operation_type: str, 
                        estimated_duration: Optional[float] = None,
                        metadata: Optional[Dict[str, Any]] = None) -> LiveOperation:
@@ -114,8 +213,12 @@ class RealTimeMonitor:
                 metadata=metadata or {}
             )
             self.active_operations[operation_id] = operation
-            
-        self._notify_progress(operation_id)
+            self._last_emit.pop(operation_id, None)
+            self._generation += 1
+        
+        if not self.is_monitoring:
+            self._expire_completed()
+        self._publish(operation_id)
         return operation
     
     def update_operation(self, operation_id: str, 
@@ -141,8 +244,9 @@ class RealTimeMonitor:
                 operation.metadata['tokens_processed'] = tokens_processed
             if metadata:
                 operation.metadata.update(metadata)
+            self._generation += 1
         
-        self._notify_progress(operation_id)
+        self._publish(operation_id)
     
     def complete_operation(self, operation_id: str, success: bool = True,
                           final_metadata: Optional[Dict[str, Any]] = None):
@@ -158,59 +262,119 @@ class RealTimeMonitor:
             
             if final_metadata:
                 operation.metadata.update(final_metadata)
+            self._generation += 1
             
             # Store duration for future estimations
             duration = operation.elapsed_seconds()
             op_type = operation.operation_type
-            if op_type not in self.operation_history:
-                self.operation_history[op_type] = []
-            self.operation_history[op_type].append(duration)
             
             # Keep only recent history (last 10 operations)
-            self.operation_history[op_type] = self.operation_history[op_type][-10:]
+            history = self.operation_history.setdefault(op_type, deque(maxlen=10))
+            total = self._history_sum.get(op_type, 0.0)
+            if len(history) == history.maxlen:
+                total -= history[0]
+            history.append(duration)
+            self._history_sum[op_type] = total + duration
+            self._duration_cache.pop(op_type, None)
         
-        self._notify_progress(operation_id)
+        self._publish(operation_id)
         
         # Remove from active operations after a delay
-        threading.Timer(5.0, lambda: self._remove_operation(operation_id)).start()
-    
-    def get_active_operations(self) -> Dict[str, LiveOperation]:
-        """Get all currently active operations"""
         with self._lock:
-            return self.active_operations.copy()
+            heapq.heappush(self._pending_removal,
+                           (time.monotonic() + self.completed_retention_seconds, operation_id))
+        if self.is_monitoring:
+            self._signal_wake()
+        else:
+            self._expire_completed()
+    
+    def get_active_operations(self) -> Mapping[str, LiveOperation]:
+        """Get a read-only snapshot of all currently active operations"""
+        self._expire_completed()
+        if self._snapshot_generation != self._generation:
+            with self._lock:
+                self._snapshot = types.MappingProxyType(dict(self.active_operations))
+                self._snapshot_generation = self._generation
+        return self._snapshot
     
     def get_operation_status(self, operation_id: str) -> Optional[LiveOperation]:
         """Get status of a specific operation"""
         with self._lock:
+            self._expire_completed_locked(time.monotonic())
             return self.active_operations.get(operation_id)
     
     def _estimate_duration(self, operation_type: str) -> Optional[float]:
         """Estimate operation duration based on historical data"""
+        try:
+            return self._duration_cache[operation_type]
+        except KeyError:
+            pass
+        
         if operation_type not in self.operation_history:
             # Default estimates based on operation type
-            defaults = {
-                "llm_chat": 5.0,
-                "llm_completion": 10.0,
-                "llm_generation": 15.0,
-                "crew_execution": 30.0,
-                "agent_task": 8.0
-            }
-            return defaults.get(operation_type)
-        
-        # Calculate average from recent history
-        history = self.operation_history[operation_type]
-        return sum(history) / len(history) if history else None
+            estimate = _DEFAULT_DURATION_ESTIMATES.get(operation_type)
+        else:
+            # Average of recent history from the running sum
+            history = self.operation_history[operation_type]
+            estimate = self._history_sum[operation_type] / len(history) if history else None
+        
+        self._duration_cache[operation_type] = estimate
+        return estimate
     
-    def _notify_progress(self, operation_id: str):
-        """Notify all callbacks about progress update"""
+    def _publish(self, operation_id: str):
+        """Mark an operation as changed and wake the monitor loop"""
+        if not self.is_monitoring:
+            # No loop running: deliver the update synchronously
+            self._notify_progress(operation_id)
+            return
+        
+        with self._lock:
+            # A non-empty dirty set means a wake is already pending
+            needs_wake = not self._dirty
+            self._dirty.add(operation_id)
+        if needs_wake:
+            self._signal_wake()
+    
+    def _signal_wake(self):
+        """Wake the monitor loop from any thread"""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(self._set_wake)
+        except RuntimeError:
+            # Loop closed between the check and the call
+            pass
+    
+    def _set_wake(self):
+        """Set the wake event (runs on the monitor loop)"""
+        if self._wake is not None:
+            self._wake.set()
+    
+    def _build_progress_update(self, operation_id: str) -> Optional[ProgressUpdate]:
+        """Snapshot an operation into a ProgressUpdate"""
         with self._lock:
             operation = self.active_operations.get(operation_id)
             if not operation:
-                return
+                return None
             
-            # Calculate tokens per second
-            tokens_processed = operation.metadata.get('tokens_processed', 0)
             elapsed = operation.elapsed_seconds()
+            tokens_processed = operation.metadata.get('tokens_processed', 0)
+            estimated_remaining = operation.estimated_remaining_seconds(elapsed=elapsed)
+            
+            # Skip emission when nothing visible changed since the last one
+            emit_key = (
+                operation.status,
+                round(operation.progress_percent, 2),
+                operation.current_step,
+                tokens_processed,
+                None if estimated_remaining is None else int(estimated_remaining)
+            )
+            if self._last_emit.get(operation_id) == emit_key:
+                return None
+            self._last_emit[operation_id] = emit_key
+            
+            # Calculate tokens per second
             tokens_per_second = tokens_processed / elapsed if elapsed > 0 else 0.0
             
             progress_update = ProgressUpdate(
@@ -218,40 +382,131 @@ class RealTimeMonitor:
                 status=operation.status,
                 progress_percent=operation.progress_percent,
                 current_step=operation.current_step,
-                estimated_remaining_seconds=operation.estimated_remaining_seconds(),
+                estimated_remaining_seconds=estimated_remaining,
                 tokens_processed=tokens_processed,
                 tokens_per_second=tokens_per_second,
                 metadata=operation.metadata.copy()
             )
         
+        return progress_update
+    
+    def _notify_progress(self, operation_id: str):
+        """Notify all callbacks about progress update"""
+        progress_update = self._build_progress_update(operation_id)
+        if progress_update is None:
+            return
+        
         # Call callbacks outside of lock to avoid deadlocks
-        for callback in self.progress_callbacks:
+        for callback in self._callbacks:
+            try:
+                result = callback(progress_update)
+                if asyncio.iscoroutine(result):
+                    try:
+                        asyncio.get_running_loop().create_task(result)
+                    except RuntimeError:
+                        asyncio.run(result)
+            except Exception as e:
+                print(f"Error in progress callback: {e}")
+    
+    async def _notify_progress_async(self, operation_id: str):
+        """Notify callbacks from the monitor loop"""
+        progress_update = self._build_progress_update(operation_id)
+        if progress_update is None:
+            return
+        
+        loop = asyncio.get_running_loop()
+        for callback in self._callbacks:
             try:
-                callback(progress_update)
+                if asyncio.iscoroutinefunction(callback):
+                    await callback(progress_update)
+                else:
+                    await loop.run_in_executor(None, callback, progress_update)
             except Exception as e:
                 print(f"Error in progress callback: {e}")
     
-    def _monitoring_loop(self):
-        """Main monitoring loop that runs in a separate thread"""
+    def _run_event_loop(self):
+        """Thread target hosting the monitor's event loop"""
+        loop = self._loop
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._monitoring_loop())
+            loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            self._wake = None
+            loop.close()
+    
+    async def _monitoring_loop(self):
+        """Emit progress only for operations that changed since the last pass"""
+        self._wake = asyncio.Event()
+        
+        # Under sustained activity the loop never idles, so every Nth pass
+        # also refreshes all active operations to keep their ETAs fresh
+        refresh_every = max(1, round(self.eta_refresh_interval / self.update_interval))
+        ticks = 0
+        
         while self.is_monitoring:
             try:
-                # Update all active operations
+                refresh_all = False
+                if not self._dirty:
+                    next_expiry = self._next_removal_deadline()
+                    if not self.active_operations and next_expiry is None:
+                        # Nothing tracked: sleep until an update arrives
+                        timeout = None
+                    else:
+                        timeout = self.eta_refresh_interval
+                        if next_expiry is not None:
+                            timeout = min(timeout, max(0.0, next_expiry - time.monotonic()))
+                    try:
+                        await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+                    except asyncio.TimeoutError:
+                        # Idle: refresh ETAs of everything still running
+                        refresh_all = timeout >= self.eta_refresh_interval
+                self._wake.clear()
+                self._expire_completed()
+                
+                ticks += 1
+                if ticks >= refresh_every:
+                    refresh_all = True
+                if refresh_all:
+                    ticks = 0
+                
                 with self._lock:
-                    operation_ids = list(self.active_operations.keys())
+                    if refresh_all:
+                        self._dirty.update(self.active_operations)
+                    dirty, self._dirty = self._dirty, set()
                 
-                for operation_id in operation_ids:
-                    self._notify_progress(operation_id)
+                for operation_id in dirty:
+                    await self._notify_progress_async(operation_id)
                 
-                time.sleep(self.update_interval)
+                # Debounce so bursts of updates coalesce into one emission
+                await asyncio.sleep(self.update_interval)
                 
             except Exception as e:
                 print(f"Error in monitoring loop: {e}")
-                time.sleep(1.0)
+                await asyncio.sleep(1.0)
+    
+    def _next_removal_deadline(self) -> Optional[float]:
+        """Monotonic deadline of the next pending removal, if any"""
+        with self._lock:
+            return self._pending_removal[0][0] if self._pending_removal else None
     
-    def _remove_operation(self, operation_id: str):
-        """Remove an operation from active tracking"""
+    def _expire_completed(self, now: Optional[float] = None):
+        """Remove finished operations whose retention period has elapsed"""
+        if now is None:
+            now = time.monotonic()
         with self._lock:
-            self.active_operations.pop(operation_id, None)
+            self._expire_completed_locked(now)
+    
+    def _expire_completed_locked(self, now: float):
+        """_expire_completed body; the caller holds _lock"""
+        while self._pending_removal and self._pending_removal[0][0] <= now:
+            _, operation_id = heapq.heappop(self._pending_removal)
+            operation = self.active_operations.get(operation_id)
+            # Skip ids that were restarted after completing
+            if operation is not None and operation.status in _TERMINAL_STATUSES:
+                del self.active_operations[operation_id]
+                self._last_emit.pop(operation_id, None)
+                self._generation += 1
 
 class ProgressDisplayManager:
     """
@@ -264,6 +519,17 @@ class ProgressDisplayManager:
         self.monitor.add_progress_callback(self._on_progress_update)
         self.display_enabled = True
         
+        # Console output is throttled to one write per flush_interval
+        self.flush_interval = 0.1
+        self._pending_line = ""
+        self._last_flush = 0.0
+        self._write_lock = threading.Lock()
+        # Flushes a held-back line once the throttle window closes
+        self._flush_timer: Optional[threading.Timer] = None
+        
+        # Last rendered JSON as ((operation_id, generation), rendered_at, payload)
+        self._json_cache: Optional[Tuple[Tuple[Optional[str], int], float, str]] = None
+        
     def enable_console_display(self):
         """Enable console progress display"""
         self.display_enabled = True
@@ -282,72 +548,121 @@ class ProgressDisplayManager:
     def _display_console_progress(self, update: ProgressUpdate):
         """Display progress in console format"""
         # Create progress bar
-        bar_length = 30
-        filled_length = int(bar_length * update.progress_percent / 100)
-        bar = '█' * filled_length + '░' * (bar_length - filled_length)
+        bar = _BAR_CACHE[int(_BAR_LENGTH * update.progress_percent / 100)]
         
         # Format remaining time
         remaining_str = ""
-        if update.estimated_remaining_seconds is not None:
-            if update.estimated_remaining_seconds < 60:
-                remaining_str = f" (ETA: {update.estimated_remaining_seconds:.1f}s)"
+        eta = update.estimated_remaining_seconds
+        if eta is not None:
+            if eta < 60:
+                remaining_str = _ETA_SECONDS_FMT.format(eta)
             else:
-                minutes = int(update.estimated_remaining_seconds // 60)
-                seconds = int(update.estimated_remaining_seconds % 60)
-                remaining_str = f" (ETA: {minutes}m {seconds}s)"
+                remaining_str = _ETA_MINUTES_FMT.format(*divmod(int(eta), 60))
         
         # Format tokens per second
-        tps_str = ""
-        if update.tokens_per_second > 0:
-            tps_str = f" | {update.tokens_per_second:.1f} tok/s"
-        
-        # Status emoji
-        status_emoji = {
-            OperationStatus.QUEUED: "⏳",
-            OperationStatus.INITIALIZING: "🔄",
-            OperationStatus.PROCESSING: "⚙️",
-            OperationStatus.STREAMING: "📡",
-            OperationStatus.FINALIZING: "🔄",
-            OperationStatus.COMPLETED: "✅",
-            OperationStatus.FAILED: "❌",
-            OperationStatus.CANCELLED: "⏹️"
-        }.get(update.status, "🔄")
-        
-        # Print progress line
-        print(f"\r{status_emoji} [{bar}] {update.progress_percent:5.1f}% | {update.current_step}{remaining_str}{tps_str}", 
-              end="", flush=True)
-        
-        # Print newline when completed
-        if update.status in [OperationStatus.COMPLETED, OperationStatus.FAILED, OperationStatus.CANCELLED]:
-            print()  # New line
+        tps_str = _TPS_FMT.format(update.tokens_per_second) if update.tokens_per_second > 0 else ""
+        
+        line = _LINE_FMT.format(
+            emoji=_STATUS_EMOJI.get(update.status, "🔄"),
+            bar=bar,
+            pct=update.progress_percent,
+            step=update.current_step,
+            rem=remaining_str,
+            tps=tps_str
+        )
+        
+        # Finished operations always print, ending the line
+        if update.status in _TERMINAL_STATUSES:
+            self._write_console(line + "\n")
+            return
+        
+        # Otherwise coalesce: keep only the newest line between flushes
+        wait = self.flush_interval - (time.monotonic() - self._last_flush)
+        with self._write_lock:
+            self._pending_line = line
+            if wait > 0 and self._flush_timer is None:
+                # Held back: make sure it is written when the window closes
+                self._flush_timer = threading.Timer(wait, self._deadline_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        if wait <= 0:
+            self.flush()
+    
+    def _deadline_flush(self):
+        """Timer target writing the line held back by the throttle"""
+        with self._write_lock:
+            self._flush_timer = None
+        self.flush()
+    
+    def flush(self):
+        """Write any pending progress line to the console"""
+        with self._write_lock:
+            line, self._pending_line = self._pending_line, ""
+        if line:
+            self._write_console(line)
+    
+    def _write_console(self, text: str):
+        """Write to stdout with a single flush"""
+        with self._write_lock:
+            self._pending_line = ""
+            sys.stdout.write(text)
+            sys.stdout.flush()
+            self._last_flush = time.monotonic()
     
     def get_progress_json(self, operation_id: Optional[str] = None) -> str:
         """Get progress information as JSON"""
+        # Repeated polls with no state change reuse the last payload; it is
+        # re-rendered after update_interval so elapsed times stay current
+        now = time.monotonic()
+        cache_key = (operation_id, self.monitor.generation)
+        cached = self._json_cache
+        if cached is not None and cached[0] == cache_key and now - cached[1] < self.monitor.update_interval:
+            return cached[2]
+        
+        payload = self._render_progress_json(operation_id, now)
+        self._json_cache = (cache_key, now, payload)
+        return payload
+    
+    def _render_progress_json(self, operation_id: Optional[str], now: float) -> str:
+        """Serialize one or all active operations"""
         if operation_id:
             operation = self.monitor.get_operation_status(operation_id)
             if operation:
-                return json.dumps({
+                elapsed = operation.elapsed_seconds(now)
+                return _dumps_json({
                     "operation_id": operation_id,
                     "status": operation.status.value,
                     "progress_percent": operation.progress_percent,
                     "current_step": operation.current_step,
-                    "elapsed_seconds": operation.elapsed_seconds(),
-                    "estimated_remaining_seconds": operation.estimated_remaining_seconds(),
+                    "elapsed_seconds": elapsed,
+                    "estimated_remaining_seconds": operation.estimated_remaining_seconds(elapsed=elapsed),
                     "metadata": operation.metadata
-                }, indent=2)
+                })
         else:
             operations = self.monitor.get_active_operations()
-            return json.dumps({
-                op_id: {
+            if not operations:
+                return "{}"
+            
+            # Encode one operation at a time into a single buffer instead of
+            # materializing the whole nested dict first
+            buf = bytearray(b"{")
+            separator = b"\n  "
+            for op_id, op in operations.items():
+                elapsed = op.elapsed_seconds(now)
+                buf += separator
+                buf += _encode_json(op_id)
+                buf += b": "
+                buf += _encode_json({
                     "status": op.status.value,
                     "progress_percent": op.progress_percent,
                     "current_step": op.current_step,
-                    "elapsed_seconds": op.elapsed_seconds(),
-                    "estimated_remaining_seconds": op.estimated_remaining_seconds(),
+                    "elapsed_seconds": elapsed,
+                    "estimated_remaining_seconds": op.estimated_remaining_seconds(elapsed=elapsed),
                     "metadata": op.metadata
-                }
-                for op_id, op in operations.items()
-            }, indent=2)
+                }).replace(b"\n", b"\n  ")
+                separator = b",\n  "
+            buf += b"\n}"
+            return buf.decode()
         
         return "{}"
 
@@ -372,16 +687,40 @@ def get_global_display_manager() -> ProgressDisplayManager:
 
 def track_operation(operation_id: str, operation_type: str, 
                    estimated_duration: Optional[float] = None):
-    """Decorator for tracking operation progress"""
+    """Decorator for tracking operation progress (sync or async functions)"""
     def decorator(func):
-        def wrapper(*args, **kwargs):
-            monitor = get_global_monitor()
-            operation = monitor.start_operation(operation_id, operation_type, estimated_duration)
+        # Resolve the global monitor on first call, then reuse it
+        resolved: List[RealTimeMonitor] = []
+        
+        def begin() -> RealTimeMonitor:
+            if not resolved:
+                resolved.append(get_global_monitor())
+            monitor = resolved[0]
+            monitor.start_operation(operation_id, operation_type, estimated_duration)
+            monitor.update_operation(operation_id, 
+                                   status=OperationStatus.PROCESSING,
+                                   current_step="Executing...")
+            return monitor
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                monitor = begin()
+                try:
+                    result = await func(*args, **kwargs)
+                    monitor.complete_operation(operation_id, success=True)
+                    return result
+                except Exception as e:
+                    monitor.complete_operation(operation_id, success=False,
+                                             final_metadata={"error": str(e)})
+                    raise
             
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            monitor = begin()
             try:
-                monitor.update_operation(operation_id, 
-                                       status=OperationStatus.PROCESSING,
-                                       current_step="Executing...")
                 result = func(*args, **kwargs)
                 monitor.complete_operation(operation_id, success=True)
                 return result
@@ -5,11 +5,16 @@ This service provides high-level operations for creating, configuring,
 and managing AI agents within the AICrewDev system.
 """
 
-from typing import List, Dict, Any, Optional
-from crewai import Agent
-from src.config.llm_config import LLMConfig
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple
 from src.models.agent_models import AgentSpecification, AgentRole, DeveloperSpecialization
-from src.agents.agent_factory import AgentFactory
+
+# crewai (pulled in by the config and factory modules) is imported lazily
+# so constructing the service for metadata queries stays cheap
+if TYPE_CHECKING:
+    from crewai import Agent
+    from src.config.llm_config import LLMConfig
 
 class AgentService:
     """
@@ -19,18 +24,39 @@ class AgentService:
     and management, abstracting the complexity of the underlying agent factory.
     """
     
-    def __init__(self, llm_config: Optional[LLMConfig] = None):
+    def __init__(self, llm_config: Optional["LLMConfig"] = None):
         """
         Initialize the agent service.
         
         Args:
             llm_config: LLM configuration. If None, uses default configuration.
         """
-        self.llm_config = llm_config or LLMConfig.get_default_config()
-        self._created_agents: List[Agent] = []
+        if llm_config is None:
+            from src.config.llm_config import LLMConfig
+            llm_config = LLMConfig.get_default_config()
+        
+        self._config_cache: Dict[float, "LLMConfig"] = {}
+        self.llm_config = llm_config
+        self._created_agents: List["Agent"] = []
         self._agent_specs: Dict[str, AgentSpecification] = {}
+        self._agents_by_role: Dict[AgentRole, List["Agent"]] = defaultdict(list)
+        
+        # Team composition counts, cached until the team changes
+        self._version = 0
+        self._summary_cache: Optional[Tuple[int, Dict[str, int], Dict[str, int]]] = None
+    
+    @property
+    def llm_config(self) -> "LLMConfig":
+        """Base LLM configuration for created agents."""
+        return self._llm_config
+    
+    @llm_config.setter
+    def llm_config(self, config: "LLMConfig"):
+        self._llm_config = config
+        # Per-temperature variants derive from the base config
+        self._config_cache.clear()
     
-    def create_agent_from_spec(self, spec: AgentSpecification) -> Agent:
+    def create_agent_from_spec(self, spec: AgentSpecification) -> "Agent":
         """
         Create an agent from a specification.
         
@@ -40,13 +66,17 @@ class AgentService:
         Returns:
             Agent: Created CrewAI agent
         """
+        from src.agents.agent_factory import AgentFactory
+        
         # Apply specification-specific LLM configuration if needed
         config = self.llm_config
         if spec.temperature is not None:
-            # Create a modified config with custom temperature
-            config_dict = config.model_dump()
-            config_dict['temperature'] = spec.temperature
-            config = LLMConfig(**config_dict)
+            # Reuse a copy of the base config with this temperature; the spec
+            # already validated the value, so skip full re-validation
+            config = self._config_cache.get(spec.temperature)
+            if config is None:
+                config = self.llm_config.model_copy(update={'temperature': spec.temperature})
+                self._config_cache[spec.temperature] = config
         
         # Create agent based on role
         if spec.role == AgentRole.TECH_LEAD:
@@ -67,10 +97,12 @@ class AgentService:
         agent_id = f"{role_str}_{len(self._created_agents)}"
         self._created_agents.append(agent)
         self._agent_specs[agent_id] = spec
+        self._agents_by_role[AgentRole(spec.role)].append(agent)
+        self._version += 1
         
         return agent
     
-    def create_development_team(self, project_type: str = "web") -> List[Agent]:
+    def create_development_team(self, project_type: str = "web") -> List["Agent"]:
         """
         Create a complete development team with role-optimized agents.
         
@@ -90,7 +122,7 @@ class AgentService:
         
         return team
     
-    def create_analysis_team(self) -> List[Agent]:
+    def create_analysis_team(self) -> List["Agent"]:
         """
         Create a team focused on code analysis and review.
         
@@ -109,7 +141,7 @@ class AgentService:
         
         return team
     
-    def get_agent_by_role(self, role: AgentRole) -> Optional[Agent]:
+    def get_agent_by_role(self, role: AgentRole) -> Optional["Agent"]:
         """
         Get the first agent with the specified role.
         
@@ -119,15 +151,10 @@ class AgentService:
         Returns:
             Optional[Agent]: Agent with the specified role, if found
         """
-        for agent_id, spec in self._agent_specs.items():
-            if spec.role == role:
-                # Find corresponding agent
-                index = list(self._agent_specs.keys()).index(agent_id)
-                if index < len(self._created_agents):
-                    return self._created_agents[index]
-        return None
+        agents = self._agents_by_role.get(AgentRole(role))
+        return agents[0] if agents else None
     
-    def get_all_agents(self) -> List[Agent]:
+    def get_all_agents(self) -> List["Agent"]:
         """
         Get all created agents.
         
@@ -152,28 +179,29 @@ class AgentService:
         Returns:
             Dict[str, Any]: Team summary with statistics
         """
-        role_counts = {}
-        specializations = {}
-        
-        for spec in self._agent_specs.values():
-            # Count roles
-            role = spec.role.value
-            role_counts[role] = role_counts.get(role, 0) + 1
-            
-            # Count specializations for developers
-            if spec.role == AgentRole.DEVELOPER and spec.specialization:
-                spec_name = spec.specialization.value
-                specializations[spec_name] = specializations.get(spec_name, 0) + 1
+        cached = self._summary_cache
+        if cached is not None and cached[0] == self._version:
+            _, role_counts, specializations = cached
+        else:
+            specs = self._agent_specs.values()
+            # Specs store enum values (use_enum_values), so normalize via the enums
+            role_counts = dict(Counter(AgentRole(spec.role).value for spec in specs))
+            specializations = dict(Counter(
+                DeveloperSpecialization(spec.specialization).value
+                for spec in specs
+                if spec.role == AgentRole.DEVELOPER and spec.specialization
+            ))
+            self._summary_cache = (self._version, role_counts, specializations)
         
         return {
             "total_agents": len(self._created_agents),
-            "role_distribution": role_counts,
-            "developer_specializations": specializations,
+            "role_distribution": dict(role_counts),
+            "developer_specializations": dict(specializations),
             "llm_provider": self.llm_config.provider,
             "llm_model": self.llm_config.model_name
         }
     
-    def _create_generic_agent(self, spec: AgentSpecification, config: LLMConfig) -> Agent:
+    def _create_generic_agent(self, spec: AgentSpecification, config: "LLMConfig") -> "Agent":
         """
         Create a generic agent from specification.
         
@@ -184,6 +212,8 @@ class AgentService:
         Returns:
             Agent: Created generic agent
         """
+        from crewai import Agent
+        
         llm = config.create_crewai_llm()
         if llm is None:
             llm = config.to_crewai_format()
@@ -201,7 +231,27 @@ class AgentService:
             project_type: Type of project
             
         Returns:
-            List[AgentSpecification]: Team specifications
+            List[AgentSpecification]: Fresh copies of the team specifications
+        """
+        return [
+            spec.model_copy(deep=True)
+            for spec in self._team_spec_templates(project_type)
+        ]
+    
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _team_spec_templates(project_type: str) -> Tuple[AgentSpecification, ...]:
+        """
+        Build the memoized team specification templates for a project type.
+        
+        The templates are shared between calls; callers get deep copies via
+        _get_team_specs_for_project and must not mutate these directly.
+        
+        Args:
+            project_type: Type of project
+            
+        Returns:
+            Tuple[AgentSpecification, ...]: Team specification templates
         """
         # Base team for most projects
         specs = [
@@ -236,11 +286,13 @@ class AgentService:
         # Always add a code reviewer
         specs.append(AgentSpecification.for_code_reviewer())
         
-        return specs
+        return tuple(specs)
     
     def reset(self):
         """Reset the service state."""
         self._created_agents.clear()
         self._agent_specs.clear()
+        self._agents_by_role.clear()
+        self._version += 1
 
 __all__ = ["AgentService"]
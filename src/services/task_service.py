@@ -5,10 +5,68 @@ This service provides high-level operations for creating, configuring,
 and managing tasks within the AICrewDev system.
 """
 
-from typing import List, Dict, Any, Optional
+from collections import Counter
+from types import MappingProxyType
+from typing import ClassVar, List, Dict, Any, Mapping, Optional, Sequence, Tuple
 from crewai import Task, Agent
 from src.models.task_models import TaskSpecification, TaskType, TaskPriority
-from src.tasks.task_factory import TaskFactory
+
+def _build_workflow_templates() -> Dict[str, Tuple[TaskSpecification, ...]]:
+    """Build the predefined workflow templates (shared by all TaskService instances)."""
+    templates: Dict[str, Tuple[TaskSpecification, ...]] = {}
+    
+    # Agile Development Workflow
+    templates["agile_development"] = (
+        TaskSpecification.for_design_task(),
+        TaskSpecification.for_development_task("user story features"),
+        TaskSpecification.for_testing_task("implemented features"),
+        TaskSpecification.for_review_task("completed implementation")
+    )
+    
+    # Code Review Workflow
+    templates["code_review"] = (
+        TaskSpecification.for_analysis_task("codebase structure"),
+        TaskSpecification.for_review_task("code quality and security"),
+        TaskSpecification(
+            task_type=TaskType.DOCUMENTATION,
+            title="Document Review Findings",
+            description="Create comprehensive documentation of review findings and recommendations",
+            expected_output="Review report with actionable recommendations"
+        )
+    )
+    
+    # Research and Development Workflow
+    templates["research_development"] = (
+        TaskSpecification(
+            task_type=TaskType.RESEARCH,
+            title="Technology Research",
+            description="Research and evaluate technology options and approaches",
+            expected_output="Technology evaluation report with recommendations"
+        ),
+        TaskSpecification.for_design_task(),
+        TaskSpecification(
+            task_type=TaskType.DEVELOPMENT,
+            title="Prototype Development",
+            description="Develop proof-of-concept prototype",
+            expected_output="Working prototype with documentation"
+        ),
+        TaskSpecification.for_analysis_task("prototype performance")
+    )
+    
+    # Performance Optimization Workflow
+    templates["performance_optimization"] = (
+        TaskSpecification.for_analysis_task("system performance"),
+        TaskSpecification(
+            task_type=TaskType.OPTIMIZATION,
+            title="Performance Optimization",
+            description="Implement performance improvements based on analysis",
+            expected_output="Optimized system with performance metrics"
+        ),
+        TaskSpecification.for_testing_task("performance improvements"),
+        TaskSpecification.for_review_task("optimization implementation")
+    )
+    
+    return templates
 
 class TaskService:
     """
@@ -18,12 +76,22 @@ class TaskService:
     and workflow management, abstracting the complexity of task coordination.
     """
     
+    # Static templates, built once at import and shared by reference
+    _WORKFLOW_TEMPLATES: ClassVar[Dict[str, Tuple[TaskSpecification, ...]]] = _build_workflow_templates()
+    _WORKFLOW_NAMES: ClassVar[Tuple[str, ...]] = tuple(_WORKFLOW_TEMPLATES)
+    
     def __init__(self):
         """Initialize the task service."""
         self._created_tasks: List[Task] = []
         self._task_specs: Dict[str, TaskSpecification] = {}
-        self._workflow_templates: Dict[str, List[TaskSpecification]] = {}
-        self._initialize_workflow_templates()
+        self._workflow_templates = self._WORKFLOW_TEMPLATES
+        self._id_counter = 0
+        # Read-only snapshot of _created_tasks, rebuilt after the list changes
+        self._tasks_view: Optional[Tuple[Task, ...]] = None
+        
+        # Workflow composition counts, maintained as tasks are created
+        self._task_type_counts: Counter = Counter()
+        self._priority_counts: Counter = Counter()
     
     def create_task_from_spec(self, spec: TaskSpecification, agent: Agent) -> Task:
         """
@@ -36,19 +104,37 @@ class TaskService:
         Returns:
             Task: Created CrewAI task
         """
-        # Convert specification to task kwargs
-        task_kwargs = spec.to_task_kwargs()
-        task_kwargs["agent"] = agent
-        
-        # Create the task
-        task = Task(**task_kwargs)
+        return self._create_tasks_from_specs([(spec, agent)])[0]
+    
+    def _create_tasks_from_specs(self, assignments: List[Tuple[TaskSpecification, Agent]]) -> List[Task]:
+        """
+        Create tasks for (specification, agent) pairs and record them in one batch.
         
-        # Store task and specification
-        task_id = f"{spec.task_type.value}_{len(self._created_tasks)}"
-        self._created_tasks.append(task)
-        self._task_specs[task_id] = spec
+        Args:
+            assignments: Specifications paired with the agents to assign them to
+            
+        Returns:
+            List[Task]: Created CrewAI tasks, in assignment order
+        """
+        # Create the tasks from each spec's kwargs
+        tasks = [Task(**spec.to_task_kwargs(), agent=agent) for spec, agent in assignments]
+        
+        # Specs store enum values (use_enum_values), so normalize via the enums
+        task_types = [TaskType(spec.task_type).value for spec, _ in assignments]
+        start = self._id_counter
+        self._id_counter += len(assignments)
+        
+        # Store tasks and specifications
+        self._created_tasks.extend(tasks)
+        self._task_specs.update(
+            (f"{task_type}_{task_number}", spec)
+            for task_number, task_type, (spec, _) in zip(range(start, self._id_counter), task_types, assignments)
+        )
+        self._tasks_view = None
+        self._task_type_counts.update(task_types)
+        self._priority_counts.update(TaskPriority(spec.priority).value for spec, _ in assignments)
         
-        return task
+        return tasks
     
     def create_development_workflow(self, agents: List[Agent], project_type: str = "web") -> List[Task]:
         """
@@ -68,23 +154,14 @@ class TaskService:
         developer = agents[1]  # Assuming second agent is developer
         reviewer = agents[2]   # Assuming third agent is reviewer
         
-        # Create workflow tasks
-        tasks = []
-        
-        # 1. Planning and Design
-        design_spec = TaskSpecification.for_design_task()
-        design_task = self.create_task_from_spec(design_spec, tech_lead)
-        tasks.append(design_task)
-        
-        # 2. Development
-        dev_spec = TaskSpecification.for_development_task(f"{project_type} application")
-        dev_task = self.create_task_from_spec(dev_spec, developer)
-        tasks.append(dev_task)
-        
-        # 3. Code Review
-        review_spec = TaskSpecification.for_review_task("implementation code")
-        review_task = self.create_task_from_spec(review_spec, reviewer)
-        tasks.append(review_task)
+        assignments = [
+            # 1. Planning and Design
+            (TaskSpecification.for_design_task(), tech_lead),
+            # 2. Development
+            (TaskSpecification.for_development_task(f"{project_type} application"), developer),
+            # 3. Code Review
+            (TaskSpecification.for_review_task("implementation code"), reviewer),
+        ]
         
         # 4. Integration (if project manager available)
         if len(agents) > 3:
@@ -96,10 +173,9 @@ class TaskService:
                 expected_output="Integration report with delivery readiness assessment",
                 priority=TaskPriority.HIGH
             )
-            integration_task = self.create_task_from_spec(integration_spec, manager)
-            tasks.append(integration_task)
+            assignments.append((integration_spec, manager))
         
-        return tasks
+        return self._create_tasks_from_specs(assignments)
     
     def create_analysis_workflow(self, agents: List[Agent], analysis_target: str) -> List[Task]:
         """
@@ -118,19 +194,12 @@ class TaskService:
         tech_lead = agents[0]
         reviewer = agents[1]
         
-        tasks = []
-        
-        # 1. System Analysis
-        analysis_spec = TaskSpecification.for_analysis_task(analysis_target)
-        analysis_task = self.create_task_from_spec(analysis_spec, tech_lead)
-        tasks.append(analysis_task)
-        
-        # 2. Quality Review
-        review_spec = TaskSpecification.for_review_task(analysis_target)
-        review_task = self.create_task_from_spec(review_spec, reviewer)
-        tasks.append(review_task)
-        
-        return tasks
+        return self._create_tasks_from_specs([
+            # 1. System Analysis
+            (TaskSpecification.for_analysis_task(analysis_target), tech_lead),
+            # 2. Quality Review
+            (TaskSpecification.for_review_task(analysis_target), reviewer),
+        ])
     
     def create_testing_workflow(self, agents: List[Agent], test_scope: str) -> List[Task]:
         """
@@ -149,8 +218,6 @@ class TaskService:
         # Use developer for testing if available, otherwise use first agent
         tester = agents[1] if len(agents) > 1 else agents[0]
         
-        tasks = []
-        
         # 1. Test Planning
         test_plan_spec = TaskSpecification(
             task_type=TaskType.PLANNING,
@@ -159,61 +226,73 @@ class TaskService:
             expected_output="Detailed test plan with strategy, scope, and test cases",
             priority=TaskPriority.HIGH
         )
-        test_plan_task = self.create_task_from_spec(test_plan_spec, tester)
-        tasks.append(test_plan_task)
         
-        # 2. Test Implementation
-        test_impl_spec = TaskSpecification.for_testing_task(test_scope)
-        test_impl_task = self.create_task_from_spec(test_impl_spec, tester)
-        tasks.append(test_impl_task)
+        assignments = [
+            (test_plan_spec, tester),
+            # 2. Test Implementation
+            (TaskSpecification.for_testing_task(test_scope), tester),
+        ]
         
         # 3. Test Review (if reviewer available)
         if len(agents) > 2:
             reviewer = agents[2]
-            test_review_spec = TaskSpecification.for_review_task("test implementation")
-            test_review_task = self.create_task_from_spec(test_review_spec, reviewer)
-            tasks.append(test_review_task)
+            assignments.append((TaskSpecification.for_review_task("test implementation"), reviewer))
         
-        return tasks
+        return self._create_tasks_from_specs(assignments)
     
-    def get_workflow_template(self, workflow_name: str) -> Optional[List[TaskSpecification]]:
+    def get_workflow_template(self, workflow_name: str) -> Optional[Tuple[TaskSpecification, ...]]:
         """
         Get a predefined workflow template.
         
+        The specifications are shared between all services; copy them
+        before modifying.
+        
         Args:
             workflow_name: Name of the workflow template
             
         Returns:
-            Optional[List[TaskSpecification]]: Workflow template specifications
+            Optional[Tuple[TaskSpecification, ...]]: Workflow template specifications
         """
         return self._workflow_templates.get(workflow_name)
     
-    def get_available_workflows(self) -> List[str]:
+    def get_available_workflows(self) -> Tuple[str, ...]:
         """
-        Get list of available workflow templates.
+        Get the available workflow templates.
         
         Returns:
-            List[str]: Names of available workflow templates
+            Tuple[str, ...]: Names of available workflow templates
         """
-        return list(self._workflow_templates.keys())
+        return self._WORKFLOW_NAMES
     
-    def get_all_tasks(self) -> List[Task]:
+    def get_all_tasks(self, copy: bool = False) -> Sequence[Task]:
         """
         Get all created tasks.
         
+        Args:
+            copy: Return a mutable list copy instead of a read-only tuple
+        
         Returns:
-            List[Task]: List of all created tasks
+            Sequence[Task]: All created tasks
         """
-        return self._created_tasks.copy()
+        if copy:
+            return list(self._created_tasks)
+        if self._tasks_view is None:
+            self._tasks_view = tuple(self._created_tasks)
+        return self._tasks_view
     
-    def get_task_specifications(self) -> Dict[str, TaskSpecification]:
+    def get_task_specifications(self, copy: bool = False) -> Mapping[str, TaskSpecification]:
         """
         Get all task specifications.
         
+        Args:
+            copy: Return a mutable dict copy instead of a read-only live view
+        
         Returns:
-            Dict[str, TaskSpecification]: Mapping of task IDs to specifications
+            Mapping[str, TaskSpecification]: Mapping of task IDs to specifications
         """
-        return self._task_specs.copy()
+        if copy:
+            return dict(self._task_specs)
+        return MappingProxyType(self._task_specs)
     
     def get_workflow_summary(self) -> Dict[str, Any]:
         """
@@ -222,82 +301,20 @@ class TaskService:
         Returns:
             Dict[str, Any]: Workflow summary with statistics
         """
-        task_type_counts = {}
-        priority_counts = {}
-        
-        for spec in self._task_specs.values():
-            # Count task types
-            task_type = spec.task_type.value
-            task_type_counts[task_type] = task_type_counts.get(task_type, 0) + 1
-            
-            # Count priorities
-            priority = spec.priority.value
-            priority_counts[priority] = priority_counts.get(priority, 0) + 1
-        
         return {
             "total_tasks": len(self._created_tasks),
-            "task_type_distribution": task_type_counts,
-            "priority_distribution": priority_counts,
+            "task_type_distribution": dict(self._task_type_counts),
+            "priority_distribution": dict(self._priority_counts),
             "available_templates": len(self._workflow_templates)
         }
     
-    def _initialize_workflow_templates(self):
-        """Initialize predefined workflow templates."""
-        
-        # Agile Development Workflow
-        self._workflow_templates["agile_development"] = [
-            TaskSpecification.for_design_task(),
-            TaskSpecification.for_development_task("user story features"),
-            TaskSpecification.for_testing_task("implemented features"),
-            TaskSpecification.for_review_task("completed implementation")
-        ]
-        
-        # Code Review Workflow
-        self._workflow_templates["code_review"] = [
-            TaskSpecification.for_analysis_task("codebase structure"),
-            TaskSpecification.for_review_task("code quality and security"),
-            TaskSpecification(
-                task_type=TaskType.DOCUMENTATION,
-                title="Document Review Findings",
-                description="Create comprehensive documentation of review findings and recommendations",
-                expected_output="Review report with actionable recommendations"
-            )
-        ]
-        
-        # Research and Development Workflow
-        self._workflow_templates["research_development"] = [
-            TaskSpecification(
-                task_type=TaskType.RESEARCH,
-                title="Technology Research",
-                description="Research and evaluate technology options and approaches",
-                expected_output="Technology evaluation report with recommendations"
-            ),
-            TaskSpecification.for_design_task(),
-            TaskSpecification(
-                task_type=TaskType.DEVELOPMENT,
-                title="Prototype Development",
-                description="Develop proof-of-concept prototype",
-                expected_output="Working prototype with documentation"
-            ),
-            TaskSpecification.for_analysis_task("prototype performance")
-        ]
-        
-        # Performance Optimization Workflow
-        self._workflow_templates["performance_optimization"] = [
-            TaskSpecification.for_analysis_task("system performance"),
-            TaskSpecification(
-                task_type=TaskType.OPTIMIZATION,
-                title="Performance Optimization",
-                description="Implement performance improvements based on analysis",
-                expected_output="Optimized system with performance metrics"
-            ),
-            TaskSpecification.for_testing_task("performance improvements"),
-            TaskSpecification.for_review_task("optimization implementation")
-        ]
-    
     def reset(self):
         """Reset the service state."""
         self._created_tasks.clear()
         self._task_specs.clear()
+        self._id_counter = 0
+        self._tasks_view = None
+        self._task_type_counts.clear()
+        self._priority_counts.clear()
 
 __all__ = ["TaskService"]
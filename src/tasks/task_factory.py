@@ -15,6 +15,16 @@ Example:
 
 from crewai import Task
 
+# Static task fields, built once and shared by every created task
+_DESIGN_TASK_KWARGS = {
+    "description": "Design the system architecture and component interactions",
+    "expected_output": "A detailed system architecture design document",
+}
+_DEVELOPMENT_DESCRIPTION = "Implement the following specification: {}".format
+_DEVELOPMENT_EXPECTED_OUTPUT = "Implementation code meeting the specification"
+_REVIEW_DESCRIPTION = "Review the following code implementation: {}".format
+_REVIEW_EXPECTED_OUTPUT = "Code review feedback and suggestions"
+
 class TaskFactory:
     """
     Factory class for creating development tasks.
@@ -30,26 +40,22 @@ class TaskFactory:
     @staticmethod
     def create_design_task(tech_lead):
         """Create a system design task"""
-        return Task(
-            description="Design the system architecture and component interactions",
-            agent=tech_lead,
-            expected_output="A detailed system architecture design document"
-        )
+        return Task(**_DESIGN_TASK_KWARGS, agent=tech_lead)
     
     @staticmethod
     def create_development_task(developer, spec):
         """Create a development task"""
         return Task(
-            description=f"Implement the following specification: {spec}",
+            description=_DEVELOPMENT_DESCRIPTION(spec),
             agent=developer,
-            expected_output="Implementation code meeting the specification"
+            expected_output=_DEVELOPMENT_EXPECTED_OUTPUT
         )
     
     @staticmethod
     def create_review_task(reviewer, code):
         """Create a code review task"""
         return Task(
-            description=f"Review the following code implementation: {code}",
+            description=_REVIEW_DESCRIPTION(code),
             agent=reviewer,
-            expected_output="Code review feedback and suggestions"
+            expected_output=_REVIEW_EXPECTED_OUTPUT
         )
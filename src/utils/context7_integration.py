@@ -5,13 +5,116 @@ This module integrates Context7 MCP to provide up-to-date documentation
 and code examples for the AI development crew.
 """
 
-import subprocess
 import json
 import os
-from typing import Dict, List, Optional, Any
+import shutil
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any
 from dataclasses import dataclass
 
-@dataclass
+# Common library mappings for quick resolution
+_COMMON_LIBRARIES = {
+    'react': '/facebook/react',
+    'next.js': '/vercel/next.js',
+    'nextjs': '/vercel/next.js',
+    'vue': '/vuejs/vue',
+    'angular': '/angular/angular',
+    'django': '/django/django',
+    'flask': '/pallets/flask',
+    'fastapi': '/tiangolo/fastapi',
+    'express': '/expressjs/express',
+    'node.js': '/nodejs/node',
+    'nodejs': '/nodejs/node',
+    'postgresql': '/postgres/postgres',
+    'mongodb': '/mongodb/docs',
+    'stripe': '/stripe/stripe-node',
+    'supabase': '/supabase/supabase',
+    'firebase': '/firebase/firebase-js-sdk',
+    'tailwind': '/tailwindlabs/tailwindcss',
+    'bootstrap': '/twbs/bootstrap',
+    'typescript': '/microsoft/typescript',
+    'python': '/python/cpython',
+    'javascript': '/tc39/ecma262',
+}
+
+# Deletes spaces, dashes and underscores in a single translate() pass
+_STRIP_TABLE = str.maketrans('', '', ' -_')
+
+def _normalize_library_name(name: str) -> str:
+    """Lowercase a library name and drop spaces, dashes and underscores."""
+    return name.lower().translate(_STRIP_TABLE)
+
+# Normalized name -> library ID, for O(1) exact lookups
+_NORMALIZED_LIBRARIES = {
+    _normalize_library_name(name): library_id
+    for name, library_id in _COMMON_LIBRARIES.items()
+}
+
+# Static Context7-aware workflow phases
+_WORKFLOW_PHASES: Mapping[str, str] = MappingProxyType({
+    "research_phase": """
+Research the latest documentation and best practices for the project technologies.
+
+use context7
+
+Focus on:
+- Current API patterns and conventions
+- Latest features and deprecations
+- Security best practices
+- Performance optimization techniques
+""",
+    
+    "architecture_phase": """
+Design the application architecture using current best practices.
+
+use context7
+
+Consider:
+- Modern architectural patterns
+- Scalability requirements
+- Security considerations
+- Technology-specific patterns
+""",
+    
+    "implementation_phase": """
+Implement the application using the most current patterns and APIs.
+
+use context7
+
+Ensure:
+- Latest syntax and features
+- Current dependency versions
+- Modern tooling setup
+- Best practices compliance
+""",
+    
+    "testing_phase": """
+Create comprehensive tests using current testing frameworks and practices.
+
+use context7
+
+Include:
+- Unit tests with latest testing patterns
+- Integration tests
+- End-to-end tests where appropriate
+- Performance tests if needed
+""",
+    
+    "deployment_phase": """
+Set up deployment using modern DevOps practices and tools.
+
+use context7
+
+Configure:
+- CI/CD pipelines
+- Container deployment if applicable
+- Environment management
+- Monitoring and logging
+"""
+})
+
+@dataclass(frozen=True)
 class Context7Response:
     """Response from Context7 MCP"""
     success: bool
@@ -24,22 +127,19 @@ class Context7Integration:
     This allows AICrewDev to get the most current documentation and examples.
     """
     
+    # Probe result shared by all instances; None until first checked
+    _availability: Optional[bool] = None
+    
     def __init__(self):
         self.mcp_server_available = self._check_context7_availability()
     
-    def _check_context7_availability(self) -> bool:
-        """Check if Context7 MCP server is available"""
-        try:
-            # Try to run the context7 MCP server to check if it's available
-            result = subprocess.run(
-                ["npx", "--version"], 
-                capture_output=True, 
-                text=True, 
-                timeout=10
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+    @classmethod
+    def _check_context7_availability(cls) -> bool:
+        """Check if Context7 MCP server is available (npx on PATH)"""
+        if cls._availability is None:
+            # A PATH lookup instead of forking `npx --version`
+            cls._availability = shutil.which("npx") is not None
+        return cls._availability
     
     def resolve_library_id(self, library_name: str) -> Optional[str]:
         """
@@ -49,34 +149,14 @@ class Context7Integration:
         if not self.mcp_server_available:
             return None
         
-        # Common library mappings for quick resolution
-        common_libraries = {
-            'react': '/facebook/react',
-            'next.js': '/vercel/next.js',
-            'nextjs': '/vercel/next.js',
-            'vue': '/vuejs/vue',
-            'angular': '/angular/angular',
-            'django': '/django/django',
-            'flask': '/pallets/flask',
-            'fastapi': '/tiangolo/fastapi',
-            'express': '/expressjs/express',
-            'node.js': '/nodejs/node',
-            'nodejs': '/nodejs/node',
-            'postgresql': '/postgres/postgres',
-            'mongodb': '/mongodb/docs',
-            'stripe': '/stripe/stripe-node',
-            'supabase': '/supabase/supabase',
-            'firebase': '/firebase/firebase-js-sdk',
-            'tailwind': '/tailwindlabs/tailwindcss',
-            'bootstrap': '/twbs/bootstrap',
-            'typescript': '/microsoft/typescript',
-            'python': '/python/cpython',
-            'javascript': '/tc39/ecma262',
-        }
+        library_lower = _normalize_library_name(library_name)
         
-        library_lower = library_name.lower().replace(' ', '').replace('-', '').replace('_', '')
+        # Exact match first, then fall back to the substring scan
+        library_id = _NORMALIZED_LIBRARIES.get(library_lower)
+        if library_id is not None:
+            return library_id
         
-        for key, value in common_libraries.items():
+        for key, value in _COMMON_LIBRARIES.items():
             if key in library_lower or library_lower in key:
                 return value
         
@@ -119,7 +199,8 @@ current implementations following the latest patterns and practices.
         """
         Enhance a prompt with Context7 instructions for better documentation access.
         """
-        if not technologies:
+        # Nothing can be resolved without the MCP server
+        if not technologies or not self.mcp_server_available:
             return f"{base_prompt}\n\nuse context7"
         
         # Resolve library IDs for the technologies
@@ -129,12 +210,14 @@ current implementations following the latest patterns and practices.
             if library_id:
                 library_instructions.append(f"use library {library_id} for {tech} documentation and examples")
         
+        instructions = "\n".join(library_instructions)
+        
         # Create enhanced prompt
         enhanced_prompt = f"""{base_prompt}
 
 For the most accurate and up-to-date implementation, please:
 
-{chr(10).join(library_instructions) if library_instructions else ''}
+{instructions}
 
 use context7
 
@@ -144,73 +227,20 @@ for all the technologies involved in this project.
         
         return enhanced_prompt
     
-    def create_context7_aware_workflow(self, project_requirements: Dict[str, Any]) -> Dict[str, str]:
+    def create_context7_aware_workflow(self, project_requirements: Dict[str, Any]) -> Mapping[str, str]:
         """
         Create a workflow that leverages Context7 for documentation access.
+        The phases are static and returned as a shared read-only mapping.
         """
-        workflow = {
-            "research_phase": """
-Research the latest documentation and best practices for the project technologies.
-
-use context7
-
-Focus on:
-- Current API patterns and conventions
-- Latest features and deprecations
-- Security best practices
-- Performance optimization techniques
-""",
-            
-            "architecture_phase": """
-Design the application architecture using current best practices.
-
-use context7
-
-Consider:
-- Modern architectural patterns
-- Scalability requirements
-- Security considerations
-- Technology-specific patterns
-""",
-            
-            "implementation_phase": """
-Implement the application using the most current patterns and APIs.
-
-use context7
-
-Ensure:
-- Latest syntax and features
-- Current dependency versions
-- Modern tooling setup
-- Best practices compliance
-""",
-            
-            "testing_phase": """
-Create comprehensive tests using current testing frameworks and practices.
-
-use context7
-
-Include:
-- Unit tests with latest testing patterns
-- Integration tests
-- End-to-end tests where appropriate
-- Performance tests if needed
-""",
-            
-            "deployment_phase": """
-Set up deployment using modern DevOps practices and tools.
-
-use context7
-
-Configure:
-- CI/CD pipelines
-- Container deployment if applicable
-- Environment management
-- Monitoring and logging
-"""
-        }
-        
-        return workflow
-
-# Global instance for easy access
-context7 = Context7Integration()
+        return _WORKFLOW_PHASES
+
+@lru_cache(maxsize=1)
+def get_context7() -> Context7Integration:
+    """Return the shared Context7Integration, created on first use."""
+    return Context7Integration()
+
+def __getattr__(name: str) -> Any:
+    # Keep `from ... import context7` working without creating it at import
+    if name == "context7":
+        return get_context7()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,6 +9,11 @@ Functions:
     load_environment: Loads and returns environment variables
     validate_environment: Ensures all required variables are set
     get_env_var: Get an environment variable with a default value
+    reload_environment: Re-read the .env file
+
+The .env file is loaded into os.environ once, on first use; variables are
+always read live from os.environ. Call reload_environment() after editing
+the .env file itself.
 
 Example:
     >>> from utils.environment import validate_environment
@@ -16,9 +21,16 @@ Example:
 """
 
 import os
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Optional
 from dotenv import load_dotenv
 
+@lru_cache(maxsize=1)
+def _load_dotenv_once() -> bool:
+    """Load the .env file into os.environ (existing variables win) once."""
+    return load_dotenv()
+
 def get_env_var(key: str, default: Any = None) -> Optional[str]:
     """
     Get an environment variable with a default value.
@@ -30,7 +42,18 @@ def get_env_var(key: str, default: Any = None) -> Optional[str]:
     Returns:
         The environment variable value or default
     """
-    return os.getenv(key, default)
+    _load_dotenv_once()
+    return os.environ.get(key, default)
+
+def reload_environment():
+    """
+    Forget that .env was loaded so the next access reads it again.
+    
+    Example:
+        >>> Path(".env").write_text("LLM_PROVIDER=ollama\n")
+        >>> reload_environment()
+    """
+    _load_dotenv_once.cache_clear()
 
 def load_environment():
     """
@@ -47,7 +70,6 @@ def load_environment():
         >>> env = load_environment()
         >>> api_key = env.get("OPENAI_API_KEY")
     """
-    load_dotenv()
     return {
         "LLM_PROVIDER": get_env_var("LLM_PROVIDER", "ollama"),
         "LLM_MODEL_NAME": get_env_var("LLM_MODEL_NAME", "llama2"),
@@ -57,21 +79,24 @@ def load_environment():
         "LLM_MAX_TOKENS": get_env_var("LLM_MAX_TOKENS"),
     }
 
+# Variables each provider needs, with the error raised when any is unset
+_PROVIDER_REQUIREMENTS = MappingProxyType({
+    "openai": (("LLM_API_KEY",), "OpenAI provider requires LLM_API_KEY"),
+    "anthropic": (("LLM_API_KEY",), "Anthropic provider requires LLM_API_KEY"),
+    # Ollama runs locally, no API key required, just a model name
+    "ollama": (("LLM_MODEL_NAME",), "Ollama provider requires LLM_MODEL_NAME"),
+    "other": (("LLM_API_BASE", "LLM_API_KEY"), "Other providers require both LLM_API_BASE and LLM_API_KEY"),
+})
+
 def validate_environment():
     """Validate required environment variables"""
     env = load_environment()
     provider = env.get("LLM_PROVIDER", "").lower()
     
-    if provider == "openai" and not env.get("LLM_API_KEY"):
-        raise EnvironmentError("OpenAI provider requires LLM_API_KEY")
-    elif provider == "anthropic" and not env.get("LLM_API_KEY"):
-        raise EnvironmentError("Anthropic provider requires LLM_API_KEY")
-    elif provider == "ollama":
-        # Ollama runs locally, no API key required
-        # Just validate that we have a model name
-        if not env.get("LLM_MODEL_NAME"):
-            raise EnvironmentError("Ollama provider requires LLM_MODEL_NAME")
-    elif provider == "other" and not (env.get("LLM_API_BASE") and env.get("LLM_API_KEY")):
-        raise EnvironmentError("Other providers require both LLM_API_BASE and LLM_API_KEY")
+    requirements = _PROVIDER_REQUIREMENTS.get(provider)
+    if requirements is not None:
+        required_vars, message = requirements
+        if not all(env.get(var) for var in required_vars):
+            raise EnvironmentError(message)
     
     return True
@@ -10,56 +10,105 @@ This test validates all the new improvements:
 """
 
 import asyncio
+import contextvars
+import io
 import os
 import sys
 import time
+from contextlib import asynccontextmanager
+from functools import lru_cache, partial
 from pathlib import Path
 
 # Add src to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from src.config.llm_config import LLMConfig, LLMProvider
-from src.config.validators import (
-    AgentConfigValidator,
-    LLMConfigValidator,
-    ValidationError
-)
-from src.agents.async_agents import (
-    AsyncAgentFactory,
-    AsyncCrewManager,
-    AsyncOperationStatus,
-    run_development_workflow_async
-)
-from src.monitoring.real_time_monitor import RealTimeMonitor
+
+# Prime psutil's counters at import so the monitoring test reads a real delta
+try:
+    import psutil
+    psutil.cpu_percent(interval=None)
+    psutil.virtual_memory()
+except ImportError:
+    psutil = None
+
+# Per-task output buffer so concurrently running tests don't interleave prints
+_output_buffer: contextvars.ContextVar = contextvars.ContextVar("output_buffer", default=None)
+
+
+class _BufferedStdout:
+    """stdout proxy that writes to the current task's buffer when one is set"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def write(self, text):
+        buffer = _output_buffer.get()
+        return (buffer or self._stream).write(text)
+    
+    def flush(self):
+        self._stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+@asynccontextmanager
+async def _shared_harness():
+    """Yield one (LLMConfig, AsyncAgentFactory) pair shared by the async tests"""
+    from src.config.llm_config import LLMConfig, LLMProvider
+    from src.agents.async_agents import AsyncAgentFactory
+    
+    # Configure for Ollama (most likely to be available)
+    config = LLMConfig(
+        provider=LLMProvider.OLLAMA,
+        model_name="llama2",
+        temperature=0.7,
+        verbose=True
+    )
+    # Agents are built on the executor so the concurrently gathered tests
+    # don't block each other on the event loop
+    factory = AsyncAgentFactory(max_workers=2)
+    try:
+        yield config, factory
+    finally:
+        await factory.shutdown()
+
+
+async def _run_buffered(test_func, buffer):
+    """Run a test with its output captured in buffer"""
+    _output_buffer.set(buffer)
+    return await test_func()
+
+
+@lru_cache(maxsize=1)
+def _docker_status():
+    """Probe the Docker daemon once per process; returns (available, message)"""
+    try:
+        import docker
+        client = docker.from_env()
+        client.ping()
+        return True, "  ✅ Docker is available and running"
+    except ImportError:
+        return False, "  ⚠️ Docker library not installed (pip install docker)"
+    except Exception as e:
+        return False, f"  ⚠️ Docker not running: {e}"
 
 
 async def test_docker_integration():
     """Test Docker integration and validation"""
     print("\n🐳 Testing Docker Integration...")
     
-    try:
-        # Test if docker library is available
-        try:
-            import docker
-            client = docker.from_env()
-            client.ping()
-            print("  ✅ Docker is available and running")
-            return True
-        except ImportError:
-            print("  ⚠️ Docker library not installed (pip install docker)")
-            return False
-        except Exception as e:
-            print(f"  ⚠️ Docker not running: {e}")
-            return False
-    except Exception as e:
-        print(f"  ❌ Docker test failed: {e}")
-        return False
+    available, message = _docker_status()
+    print(message)
+    return available
 
 
 async def test_configuration_validation():
     """Test comprehensive configuration validation"""
     print("\n🛡️ Testing Configuration Validation...")
     
+    from src.config.validators import AgentConfigValidator, LLMConfigValidator, ValidationError
+    
     # Test agent validation
     try:
         agent_config = {
@@ -107,19 +156,13 @@ async def test_configuration_validation():
     return True
 
 
-async def test_async_operations():
+async def _run_async_operations(harness):
     """Test asynchronous agent operations"""
     print("\n⚡ Testing Async Operations...")
     
-    # Configure for Ollama (most likely to be available)
-    config = LLMConfig(
-        provider=LLMProvider.OLLAMA,
-        model_name="llama2",
-        temperature=0.7,
-        verbose=True
-    )
+    from src.agents.async_agents import AsyncOperationStatus
     
-    factory = AsyncAgentFactory(max_workers=2)
+    config, factory = harness
     
     try:
         # Test concurrent agent creation
@@ -139,15 +182,20 @@ async def test_async_operations():
         ]
         
         print("  🚀 Creating agents concurrently...")
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         results = await factory.create_agents_batch_async(agent_configs, config)
         
-        end_time = time.time()
+        end_time = time.perf_counter()
         duration = end_time - start_time
         
-        successful_agents = [r for r in results if r.status == AsyncOperationStatus.COMPLETED]
-        failed_agents = [r for r in results if r.status == AsyncOperationStatus.FAILED]
+        successful_agents = []
+        failed_agents = []
+        for r in results:
+            if r.status == AsyncOperationStatus.COMPLETED:
+                successful_agents.append(r)
+            elif r.status == AsyncOperationStatus.FAILED:
+                failed_agents.append(r)
         
         print(f"  ✅ Created {len(successful_agents)} agents in {duration:.2f}s")
         
@@ -156,9 +204,11 @@ async def test_async_operations():
             for result in failed_agents:
                 print(f"     • {result.error}")
         
-        # Test operation monitoring
-        active_ops = factory.get_active_operations()
-        completed_ops = factory.get_completed_operations()
+        # Test operation monitoring, counting only this batch's operations
+        # since the factory is shared with concurrently running tests
+        own_ids = {r.operation_id for r in results}
+        active_ops = own_ids.intersection(factory.get_active_operations())
+        completed_ops = own_ids.intersection(factory.get_completed_operations())
         
         print(f"  📊 Active operations: {len(active_ops)}")
         print(f"  📊 Completed operations: {len(completed_ops)}")
@@ -168,8 +218,6 @@ async def test_async_operations():
     except Exception as e:
         print(f"  ❌ Async operations test failed: {e}")
         return False
-    finally:
-        await factory.shutdown()
 
 
 async def test_monitoring_system():
@@ -177,18 +225,18 @@ async def test_monitoring_system():
     print("\n📊 Testing Monitoring System...")
     
     try:
+        from src.monitoring.real_time_monitor import RealTimeMonitor
+        
         monitor = RealTimeMonitor()
         
         # Test basic monitoring functionality
         print("  ✅ Real-time monitor initialized")
         
-        # Simulate some operations
-        await asyncio.sleep(0.5)
-        
         # Test metrics collection (basic)
-        import psutil
+        if psutil is None:
+            raise ImportError("psutil is required for system metrics")
         memory_info = psutil.virtual_memory()
-        cpu_percent = psutil.cpu_percent()
+        cpu_percent = psutil.cpu_percent(interval=None)
         
         print(f"  📈 Memory usage: {memory_info.percent:.1f}%")
         print(f"  📈 CPU usage: {cpu_percent:.1f}%")
@@ -201,20 +249,17 @@ async def test_monitoring_system():
         return False
 
 
-async def test_full_workflow():
+async def _run_full_workflow(harness):
     """Test complete async development workflow"""
     print("\n🎯 Testing Full Async Workflow...")
     
-    config = LLMConfig(
-        provider=LLMProvider.OLLAMA,
-        model_name="llama2",
-        temperature=0.7,
-        verbose=True
-    )
+    from src.agents.async_agents import AsyncOperationStatus, run_development_workflow_async
+    
+    config, factory = harness
     
     try:
         print("  🚀 Starting development workflow...")
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Custom tasks for testing
         custom_tasks = [
@@ -226,10 +271,11 @@ async def test_full_workflow():
             project_type="test_project",
             llm_config=config,
             team_size="minimal",  # Use minimal for faster testing
-            custom_tasks=custom_tasks
+            custom_tasks=custom_tasks,
+            agent_factory=factory
         )
         
-        end_time = time.time()
+        end_time = time.perf_counter()
         duration = end_time - start_time
         
         if result.status == AsyncOperationStatus.COMPLETED:
@@ -258,19 +304,15 @@ async def run_comprehensive_test():
     print("• Real-time monitoring for observability")
     print("• Complete workflow orchestration")
     
-    # Run all tests
-    tests = [
+    # Fast, environment-sensitive tests run one at a time first
+    serial_tests = [
         ("Docker Integration", test_docker_integration),
-        ("Configuration Validation", test_configuration_validation),
-        ("Async Operations", test_async_operations),
-        ("Monitoring System", test_monitoring_system),
-        ("Full Workflow", test_full_workflow)
+        ("Configuration Validation", test_configuration_validation)
     ]
-    
     results = {}
-    total_start_time = time.time()
+    total_start_time = time.perf_counter()
     
-    for test_name, test_func in tests:
+    for test_name, test_func in serial_tests:
         try:
             result = await test_func()
             results[test_name] = result
@@ -278,45 +320,86 @@ async def run_comprehensive_test():
             print(f"\n❌ {test_name} failed with exception: {e}")
             results[test_name] = False
     
-    total_duration = time.time() - total_start_time
+    async with _shared_harness() as harness:
+        # Independent, await-bound tests then overlap
+        parallel_tests = [
+            ("Async Operations", partial(_run_async_operations, harness)),
+            ("Monitoring System", test_monitoring_system),
+            ("Full Workflow", partial(_run_full_workflow, harness))
+        ]
+        
+        buffers = [io.StringIO() for _ in parallel_tests]
+        stdout = sys.stdout
+        sys.stdout = _BufferedStdout(stdout)
+        try:
+            gathered = await asyncio.gather(
+                *(_run_buffered(test_func, buffer) for (_, test_func), buffer in zip(parallel_tests, buffers)),
+                return_exceptions=True
+            )
+        finally:
+            sys.stdout = stdout
+    
+    # Replay each test's output in declared order
+    for buffer in buffers:
+        print(buffer.getvalue(), end="")
     
-    # Print summary
-    print("\n" + "=" * 60)
-    print("🎉 TEST SUMMARY")
-    print("=" * 60)
+    results.update({
+        test_name: False if isinstance(result, Exception) else bool(result)
+        for (test_name, _), result in zip(parallel_tests, gathered)
+    })
+    for (test_name, _), result in zip(parallel_tests, gathered):
+        if isinstance(result, Exception):
+            print(f"\n❌ {test_name} failed with exception: {result}")
+    
+    total_duration = time.perf_counter() - total_start_time
     
     passed_tests = sum(results.values())
     total_tests = len(results)
     
-    for test_name, passed in results.items():
-        status = "✅ PASSED" if passed else "❌ FAILED"
-        print(f"{test_name:<25} {status}")
-    
-    print(f"\nResults: {passed_tests}/{total_tests} tests passed")
-    print(f"Total duration: {total_duration:.2f} seconds")
+    # Build the summary and write it in one go
+    lines = [
+        "\n" + "=" * 60,
+        "🎉 TEST SUMMARY",
+        "=" * 60
+    ]
+    lines.extend(
+        f"{test_name:<25} {'✅ PASSED' if passed else '❌ FAILED'}"
+        for test_name, passed in results.items()
+    )
+    lines.append(f"\nResults: {passed_tests}/{total_tests} tests passed")
+    lines.append(f"Total duration: {total_duration:.2f} seconds")
     
     if passed_tests == total_tests:
-        print("\n🎉 All tests passed! AICrewDev enhancements are working correctly.")
-        print("The system is ready for production use with:")
-        print("  • Async operations for 4x performance improvement")
-        print("  • Docker integration for safe code execution")
-        print("  • Comprehensive validation preventing errors")
-        print("  • Real-time monitoring for observability")
-        print("  • Production-ready documentation and examples")
+        lines.extend([
+            "\n🎉 All tests passed! AICrewDev enhancements are working correctly.",
+            "The system is ready for production use with:",
+            "  • Async operations for 4x performance improvement",
+            "  • Docker integration for safe code execution",
+            "  • Comprehensive validation preventing errors",
+            "  • Real-time monitoring for observability",
+            "  • Production-ready documentation and examples"
+        ])
     else:
-        print(f"\n⚠️ {total_tests - passed_tests} tests failed. Please check the issues above.")
+        lines.append(f"\n⚠️ {total_tests - passed_tests} tests failed. Please check the issues above.")
         
         if not results.get("Docker Integration", False):
-            print("\n🐳 Docker Setup Instructions:")
-            print("  1. Install Docker Desktop: https://www.docker.com/products/docker-desktop")
-            print("  2. Start Docker Desktop")
-            print("  3. Verify with: docker --version")
+            lines.extend([
+                "\n🐳 Docker Setup Instructions:",
+                "  1. Install Docker Desktop: https://www.docker.com/products/docker-desktop",
+                "  2. Start Docker Desktop",
+                "  3. Verify with: docker --version"
+            ])
         
         if not results.get("Async Operations", False):
-            print("\n⚡ Async Operations Issues:")
-            print("  1. Check if Ollama is running: ollama serve")
-            print("  2. Pull llama2 model: ollama pull llama2")
-            print("  3. Or configure a different LLM provider")
+            lines.extend([
+                "\n⚡ Async Operations Issues:",
+                "  1. Check if Ollama is running: ollama serve",
+                "  2. Pull llama2 model: ollama pull llama2",
+                "  3. Or configure a different LLM provider"
+            ])
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
     
     return passed_tests == total_tests
 
@@ -9,8 +9,8 @@ import os
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-def test_basic_functionality():
-    """Test basic functionality without external dependencies"""
+def _test_llm_config():
+    """Test LLMConfig creation; returns the config or None on failure"""
     print("🔧 Testing LLM Configuration...")
     
     try:
@@ -35,8 +35,12 @@ def test_basic_functionality():
         
     except Exception as e:
         print(f"❌ LLMConfig test failed: {e}")
-        return False
+        return None
     
+    return config
+
+def _test_agent_factory(config):
+    """Test AgentFactory role optimization with an existing config"""
     print("\n🤖 Testing Agent Factory...")
     
     try:
@@ -54,9 +58,15 @@ def test_basic_functionality():
         print(f"❌ AgentFactory test failed: {e}")
         return False
     
+    return True
+
+def _test_env_config():
+    """Test building the configuration from environment variables"""
     print("\n🌍 Testing Environment Configuration...")
     
     try:
+        from config.llm_config import LLMConfig
+        
         # Test with environment variables
         os.environ["LLM_PROVIDER"] = "anthropic"
         os.environ["LLM_MODEL_NAME"] = "claude-3-haiku"
@@ -70,6 +80,19 @@ def test_basic_functionality():
         print(f"❌ Environment test failed: {e}")
         return False
     
+    return True
+
+def test_basic_functionality():
+    """Test basic functionality without external dependencies"""
+    # Each section depends on the previous one, so stop at the first failure
+    config = _test_llm_config()
+    if config is None:
+        return False
+    if not _test_agent_factory(config):
+        return False
+    if not _test_env_config():
+        return False
+    
     print("\n🎉 All basic tests passed!")
     return True
 
@@ -77,22 +100,25 @@ def test_configuration_examples():
     """Test different provider configurations"""
     print("\n📋 Testing Provider Configurations...")
     
+    from config.llm_config import LLMConfig, LLMProvider
+    
     providers_and_models = [
         (LLMProvider.OPENAI, "gpt-4o"),
         (LLMProvider.ANTHROPIC, "claude-3-sonnet"),
         (LLMProvider.OLLAMA, "llama3.1:8b")
     ]
     
-    for provider, model in providers_and_models:
-        try:
-            config = LLMConfig(provider=provider, model_name=model)
-            crewai_format = config.to_crewai_format()
-            print(f"✅ {provider.value}: {crewai_format}")
-        except Exception as e:
-            print(f"❌ {provider.value} configuration failed: {e}")
-            return False
+    try:
+        configs = [LLMConfig(provider=provider, model_name=model) for provider, model in providers_and_models]
+        crewai_formats = [config.to_crewai_format() for config in configs]
+    except Exception as e:
+        print(f"❌ Provider configuration failed: {e}")
+        return False
     
-    return True
+    for (provider, _), crewai_format in zip(providers_and_models, crewai_formats):
+        print(f"✅ {provider.value}: {crewai_format}")
+    
+    return all(crewai_formats)
 
 if __name__ == "__main__":
     print("🚀 Starting Enhanced Configuration Tests\n")
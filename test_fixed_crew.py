@@ -7,22 +7,73 @@ to ensure the fixes work properly.
 """
 
 import os
+import socket
 import sys
+import unittest
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+from urllib.parse import urlparse
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.main import AICrewDev
 from src.config.llm_config import LLMConfig, LLMProvider
+from src.config.validators import ValidationError
 
-def test_without_delegation():
+# Default endpoints probed when no base URL is configured
+_DEFAULT_ENDPOINTS = {
+    LLMProvider.OLLAMA.value: ("localhost", 11434),
+    LLMProvider.OPENAI.value: ("api.openai.com", 443),
+    LLMProvider.ANTHROPIC.value: ("api.anthropic.com", 443),
+}
+
+@lru_cache(maxsize=1)
+def _llm_reachable(timeout: float = 0.5) -> bool:
+    """Quick TCP probe of the configured LLM backend (cached per process)"""
+    config = LLMConfig.get_default_config()
+    provider = LLMProvider(config.provider).value
+    
+    # Hosted providers are unusable without a key, whatever the network says
+    if provider != LLMProvider.OLLAMA.value and not config.api_key:
+        return False
+    
+    if config.base_url:
+        url = urlparse(config.base_url)
+        endpoint = (url.hostname, url.port or (443 if url.scheme == "https" else 80))
+    else:
+        endpoint = _DEFAULT_ENDPOINTS[provider]
+    
+    try:
+        with socket.create_connection(endpoint, timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+@dataclass
+class RunOutcome:
+    """Classified result of one crew run"""
+    passed: bool
+    error: Optional[Exception] = None
+    # Setup problems (environment, imports, validation) fail every run alike
+    configuration_error: bool = False
+    # The unhashable-type failure raised by CrewAI's delegation tools
+    delegation_tool_error: bool = False
+    
+    @classmethod
+    def from_error(cls, error: Exception) -> "RunOutcome":
+        return cls(
+            passed=False,
+            error=error,
+            configuration_error=isinstance(error, (EnvironmentError, ImportError, ValidationError)),
+            delegation_tool_error="unhashable type" in str(error)
+        )
+
+def _run_without_delegation(ai_crew) -> RunOutcome:
     """Test crew execution without delegation (should work)"""
     print("🧪 Testing crew execution WITHOUT delegation...")
     
     try:
-        # Create AICrewDev instance
-        ai_crew = AICrewDev()
-        
         # Run without delegation
         result = ai_crew.run(
             project_type="web",
@@ -32,20 +83,17 @@ def test_without_delegation():
         
         print("✅ SUCCESS: Crew executed without delegation!")
         print(f"📄 Result length: {len(str(result))} characters")
-        return True
+        return RunOutcome(passed=True)
         
     except Exception as e:
         print(f"❌ FAILED: {e}")
-        return False
+        return RunOutcome.from_error(e)
 
-def test_with_delegation():
+def _run_with_delegation(ai_crew) -> RunOutcome:
     """Test crew execution with delegation (may have issues)"""
     print("\n🧪 Testing crew execution WITH delegation...")
     
     try:
-        # Create AICrewDev instance
-        ai_crew = AICrewDev()
-        
         # Run with delegation
         result = ai_crew.run(
             project_type="web",
@@ -55,36 +103,58 @@ def test_with_delegation():
         
         print("✅ SUCCESS: Crew executed with delegation!")
         print(f"📄 Result length: {len(str(result))} characters")
-        return True
+        return RunOutcome(passed=True)
         
     except Exception as e:
         print(f"❌ FAILED: {e}")
-        if "unhashable type" in str(e):
+        outcome = RunOutcome.from_error(e)
+        if outcome.delegation_tool_error:
             print("💡 This is the delegation tool error we're trying to fix")
-        return False
+        return outcome
 
 def main():
     """Main test function"""
     print("🚀 Testing Fixed CrewAI Delegation Issues")
     print("=" * 50)
     
+    # Fail fast instead of waiting on crew start-up and network timeouts
+    if not _llm_reachable():
+        raise unittest.SkipTest("LLM backend unavailable")
+    
+    from src.main import AICrewDev
+    
+    # One instance serves both runs
+    try:
+        ai_crew = AICrewDev()
+    except Exception as e:
+        print(f"❌ FAILED to initialize AICrewDev: {e}")
+        print("\n⚠️  Basic crew functionality is not working. Check your configuration.")
+        return
+    
     # Test without delegation first
-    success_no_delegation = test_without_delegation()
+    no_delegation = _run_without_delegation(ai_crew)
     
-    # Test with delegation
-    success_with_delegation = test_with_delegation()
+    # Test with delegation, unless setup is already known to be broken
+    if no_delegation.configuration_error:
+        print("\n⏭️  Skipping the delegation run: it would fail with the same configuration error")
+        with_delegation = no_delegation
+    else:
+        with_delegation = _run_with_delegation(ai_crew)
     
     # Summary
     print("\n📊 Test Results Summary:")
-    print(f"   Without delegation: {'✅ PASS' if success_no_delegation else '❌ FAIL'}")
-    print(f"   With delegation: {'✅ PASS' if success_with_delegation else '❌ FAIL'}")
+    print(f"   Without delegation: {'✅ PASS' if no_delegation.passed else '❌ FAIL'}")
+    print(f"   With delegation: {'✅ PASS' if with_delegation.passed else '❌ FAIL'}")
     
-    if success_no_delegation:
+    if no_delegation.passed:
         print("\n🎉 Great! Basic crew functionality is working.")
-        if not success_with_delegation:
+        if not with_delegation.passed:
             print("🔧 Delegation still needs work, but basic functionality is available.")
     else:
         print("\n⚠️  Basic crew functionality is not working. Check your configuration.")
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    except unittest.SkipTest as e:
+        print(f"⏭️  Skipped: {e}")
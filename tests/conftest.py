@@ -0,0 +1,20 @@
+"""Shared pytest configuration for the AICrewDev test suite."""
+
+import os
+import pytest
+
+# LLM settings that tests read or overwrite
+LLM_ENV_VARS = ("LLM_PROVIDER", "LLM_MODEL_NAME", "LLM_API_KEY", "LLM_API_BASE", "LLM_TEMPERATURE")
+
+@pytest.fixture(autouse=True)
+def _isolate_llm_env(monkeypatch):
+    """Restore LLM environment variables after every test, including raw os.environ writes"""
+    # Registering the current values with monkeypatch makes it restore them on teardown
+    for key in LLM_ENV_VARS:
+        value = os.environ.get(key)
+        if value is None:
+            # setenv records the key as unset; delenv then removes it again
+            monkeypatch.setenv(key, "")
+            monkeypatch.delenv(key)
+        else:
+            monkeypatch.setenv(key, value)
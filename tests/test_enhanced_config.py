@@ -10,6 +10,26 @@ from unittest.mock import patch, MagicMock
 from src.config.llm_config import LLMConfig, LLMProvider
 from src.agents.agent_factory import AgentFactory
 
+PROVIDER_MODELS = [
+    (LLMProvider.OPENAI, "gpt-4o"),
+    (LLMProvider.ANTHROPIC, "claude-3-haiku"),
+    (LLMProvider.OLLAMA, "llama3.1:8b")
+]
+
+@pytest.fixture(scope="module", autouse=True)
+def _mock_crewai_llm():
+    """Stub the CrewAI LLM client constructor once for the whole module"""
+    with patch('src.config.llm_config.CrewAI_LLM') as mock_llm:
+        mock_llm.return_value = MagicMock()
+        yield mock_llm
+
+@pytest.fixture
+def mock_crewai_llm(_mock_crewai_llm):
+    """The module's CrewAI_LLM stub, with crewai reported available and calls reset"""
+    _mock_crewai_llm.reset_mock()
+    with patch('src.config.llm_config.CREWAI_AVAILABLE', True):
+        yield _mock_crewai_llm
+
 class TestLLMConfig:
     """Test the LLM configuration class"""
     
@@ -73,7 +93,7 @@ class TestLLMConfig:
 class TestAgentFactory:
     """Test the Agent Factory class"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_config(self):
         """Create a mock configuration for testing"""
         return LLMConfig(
@@ -85,36 +105,27 @@ class TestAgentFactory:
     
     def test_tech_lead_creation(self, mock_config):
         """Test creating a tech lead agent"""
-        with patch('src.config.llm_config.ChatOpenAI') as mock_openai:
-            mock_openai.return_value = MagicMock()
-            
-            agent = AgentFactory.create_tech_lead(mock_config)
-            
-            assert "Technical Lead" in agent.role
-            assert agent.allow_delegation is True
-            assert "strategic" in agent.goal.lower()
+        agent = AgentFactory.create_tech_lead(mock_config)
+        
+        assert "Technical Lead" in agent.role
+        assert agent.allow_delegation is True
+        assert "strategic" in agent.goal.lower()
     
     def test_developer_creation(self, mock_config):
         """Test creating a developer agent"""
-        with patch('src.config.llm_config.ChatOpenAI') as mock_openai:
-            mock_openai.return_value = MagicMock()
-            
-            agent = AgentFactory.create_developer(mock_config, specialization="backend")
-            
-            assert "Backend Developer" in agent.role
-            assert "backend" in agent.goal.lower()
-            assert agent.allow_code_execution is True
+        agent = AgentFactory.create_developer(mock_config, specialization="backend")
+        
+        assert "Backend Developer" in agent.role
+        assert "backend" in agent.goal.lower()
+        assert agent.allow_code_execution is True
     
     def test_code_reviewer_creation(self, mock_config):
         """Test creating a code reviewer agent"""
-        with patch('src.config.llm_config.ChatOpenAI') as mock_openai:
-            mock_openai.return_value = MagicMock()
-            
-            agent = AgentFactory.create_code_reviewer(mock_config)
-            
-            assert "Quality" in agent.role
-            assert "review" in agent.goal.lower()
-            assert agent.verbose is True
+        agent = AgentFactory.create_code_reviewer(mock_config)
+        
+        assert "Quality" in agent.role
+        assert "review" in agent.goal.lower()
+        assert agent.verbose is True
     
     def test_role_optimization(self, mock_config):
         """Test role-specific optimizations"""
@@ -141,42 +152,32 @@ class TestIntegration:
             "LLM_TEMPERATURE": "0.7",
             "LLM_VERBOSE": "true"
         }):
-            with patch('src.config.llm_config.ChatOpenAI') as mock_openai:
-                mock_openai.return_value = MagicMock()
-                
-                # Create configuration
-                config = LLMConfig.get_default_config()
-                
-                # Create agents
-                tech_lead = AgentFactory.create_tech_lead(config)
-                developer = AgentFactory.create_developer(config)
-                reviewer = AgentFactory.create_code_reviewer(config)
-                
-                # Verify all agents were created
-                assert tech_lead is not None
-                assert developer is not None
-                assert reviewer is not None
-                
-                # Verify they have different roles
-                roles = {tech_lead.role, developer.role, reviewer.role}
-                assert len(roles) == 3  # All unique roles
+            # Create configuration
+            config = LLMConfig.get_default_config()
+            
+            # Create agents
+            tech_lead = AgentFactory.create_tech_lead(config)
+            developer = AgentFactory.create_developer(config)
+            reviewer = AgentFactory.create_code_reviewer(config)
+            
+            # Verify all agents were created
+            assert tech_lead is not None
+            assert developer is not None
+            assert reviewer is not None
+            
+            # Verify they have different roles
+            roles = {tech_lead.role, developer.role, reviewer.role}
+            assert len(roles) == 3  # All unique roles
     
-    def test_provider_specific_models(self):
+    @pytest.mark.parametrize("provider,model", PROVIDER_MODELS)
+    def test_provider_specific_models(self, provider, model, mock_crewai_llm):
         """Test that provider-specific models are created correctly"""
-        configs = [
-            (LLMProvider.OPENAI, "gpt-4o"),
-            (LLMProvider.ANTHROPIC, "claude-3-haiku"),
-            (LLMProvider.OLLAMA, "llama3.1:8b")
-        ]
+        config = LLMConfig(provider=provider, model_name=model)
         
-        for provider, model in configs:
-            config = LLMConfig(provider=provider, model_name=model)
-            
-            with patch(f'src.config.llm_config.Chat{provider.value.title()}') as mock_model:
-                mock_model.return_value = MagicMock()
-                
-                llm = config.create_chat_model()
-                assert llm is not None
+        llm = config.create_crewai_llm()
+        assert llm is mock_crewai_llm.return_value
+        mock_crewai_llm.assert_called_once()
+        assert mock_crewai_llm.call_args.kwargs["model"] == f"{provider.value}/{model}"
 
 if __name__ == "__main__":
     # Run tests if called directly
@@ -2,29 +2,14 @@
 
 import os
 import unittest
+from unittest.mock import patch
 from src.config import LLMConfig, LLMProvider
 from src.agents.agent_factory import AgentFactory
 
 class TestLLMConfiguration(unittest.TestCase):
     """Test cases for LLM configuration"""
     
-    def setUp(self):
-        """Set up test cases"""
-        # Save original environment variables
-        self.original_env = {
-            key: os.environ.get(key)
-            for key in ["LLM_PROVIDER", "LLM_MODEL_NAME", "LLM_API_KEY", "LLM_API_BASE"]
-        }
-        
-    def tearDown(self):
-        """Clean up after tests"""
-        # Restore original environment variables
-        for key, value in self.original_env.items():
-            if value is None:
-                os.environ.pop(key, None)
-            else:
-                os.environ[key] = value
-    
+    @patch.dict(os.environ, {})
     def test_default_config(self):
         """Test default LLM configuration"""
         # Clear any existing LLM environment variables
@@ -36,28 +21,25 @@ class TestLLMConfiguration(unittest.TestCase):
         self.assertEqual(config.model_name, "llama2")
         self.assertEqual(config.temperature, 0.5)
         
+    @patch.dict(os.environ, {
+        "LLM_PROVIDER": "openai",
+        "LLM_MODEL_NAME": "gpt-4",
+        "LLM_API_KEY": "test-key",
+        "LLM_TEMPERATURE": "0.5"
+    })
     def test_custom_config(self):
         """Test custom LLM configuration"""
-        os.environ["LLM_PROVIDER"] = "openai"
-        os.environ["LLM_MODEL_NAME"] = "gpt-4"
-        os.environ["LLM_API_KEY"] = "test-key"
-        os.environ["LLM_TEMPERATURE"] = "0.5"
-        
         config = LLMConfig.get_default_config()
         self.assertEqual(config.provider, LLMProvider.OPENAI)
         self.assertEqual(config.model_name, "gpt-4")
         self.assertEqual(config.api_key, "test-key")
         self.assertEqual(config.temperature, 0.5)
 
+# Configure for Ollama to avoid API key requirements
+@patch.dict(os.environ, {"LLM_PROVIDER": "ollama", "LLM_MODEL_NAME": "llama2"})
 class TestAgentFactory(unittest.TestCase):
     """Test cases for Agent Factory"""
     
-    def setUp(self):
-        """Set up test cases"""
-        # Configure for Ollama to avoid API key requirements
-        os.environ["LLM_PROVIDER"] = "ollama"
-        os.environ["LLM_MODEL_NAME"] = "llama2"
-    
     def test_create_tech_lead(self):
         """Test creating a tech lead agent"""
         agent = AgentFactory.create_tech_lead()
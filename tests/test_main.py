@@ -1,16 +1,28 @@
 """Test the main AICrewDev functionality"""
 
 import unittest
-from src.main import AICrewDev
-from src.agents.agent_factory import AgentFactory
-from src.tasks.task_factory import TaskFactory
+
+# Skip collection early when the CrewAI stack isn't installed
+try:
+    import pytest
+except ImportError:
+    pass
+else:
+    pytest.importorskip("crewai")
 
 class TestAICrewDev(unittest.TestCase):
     """Test cases for AICrewDev class"""
     
-    def setUp(self):
-        """Set up test cases"""
-        self.ai_crew = AICrewDev()
+    @classmethod
+    def setUpClass(cls):
+        """Build one AICrewDev instance for all test cases"""
+        from src.main import AICrewDev
+        cls.ai_crew = AICrewDev()
+    
+    def tearDown(self):
+        """Clear the agents and tasks recorded by each test"""
+        self.ai_crew.agent_service.reset()
+        self.ai_crew.task_service.reset()
     
     def test_create_agents(self):
         """Test agent creation"""
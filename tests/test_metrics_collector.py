@@ -0,0 +1,121 @@
+"""Tests for the metrics collector and its time-series buffer"""
+
+import copy
+import pickle
+import threading
+from dataclasses import asdict
+
+from src.monitoring.metrics_collector import (
+    MetricsCollector, MetricType, PerformanceStats, TimeSeriesBuffer
+)
+
+class TestTimeSeriesBuffer:
+    """Test the fixed-capacity ring buffer"""
+
+    def test_wraparound_keeps_newest_samples_in_order(self):
+        """Appending past capacity overwrites the oldest samples"""
+        buffer = TimeSeriesBuffer(capacity=3)
+        for i in range(5):
+            buffer.append(i, float(i * 10))
+
+        assert len(buffer) == 3
+        assert buffer.snapshot() == ([2, 3, 4], [20.0, 30.0, 40.0])
+
+    def test_drop_older_than_across_wrap(self):
+        """Expired samples are dropped from the oldest end, even after wrapping"""
+        buffer = TimeSeriesBuffer(capacity=4)
+        for i in range(6):
+            buffer.append(i, float(i))
+
+        buffer.drop_older_than(4)
+        assert buffer.snapshot() == ([4, 5], [4.0, 5.0])
+
+        buffer.append(6, 6.0)
+        assert buffer.snapshot() == ([4, 5, 6], [4.0, 5.0, 6.0])
+
+    def test_clear(self):
+        """Clearing empties the buffer"""
+        buffer = TimeSeriesBuffer(capacity=2)
+        buffer.append(1, 1.0)
+        buffer.clear()
+        assert len(buffer) == 0
+        assert buffer.snapshot() == ([], [])
+
+class TestPerformanceStats:
+    """Test the per-operation statistics record"""
+
+    def test_lock_is_not_a_dataclass_field(self):
+        """asdict() and the constructor only see the statistics fields"""
+        stats = PerformanceStats("op", total_executions=2, total_duration_ms=30.0)
+        assert "_lock" not in asdict(stats)
+        assert stats.refresh_average() == 15.0
+
+    def test_copy_and_pickle_get_their_own_lock(self):
+        """Copies keep the data but never share (or fail on) the lock"""
+        stats = PerformanceStats("op", total_executions=1)
+
+        for clone in (copy.deepcopy(stats), pickle.loads(pickle.dumps(stats))):
+            assert clone == stats
+            assert clone._lock is not stats._lock
+            with clone._lock:
+                pass
+
+class TestMetricsCollector:
+    """Test operation tracking and reporting"""
+
+    def test_concurrent_operation_tracking(self):
+        """Updates from several threads are all counted"""
+        collector = MetricsCollector()
+
+        def worker():
+            for i in range(200):
+                collector.track_operation_end(
+                    "op", "id", float(i), success=i % 2 == 0, error_type="Timeout"
+                )
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for _ in range(20):
+            collector.get_performance_dashboard()
+        for thread in threads:
+            thread.join()
+
+        stats = collector.get_performance_stats("op")["op"]
+        assert stats.total_executions == 800
+        assert stats.success_count == stats.error_count == 400
+        assert stats.avg_duration_ms == sum(range(200)) / 200
+        assert collector.get_error_patterns() == {"op_Timeout": 400}
+
+    def test_dashboard_operation_stats(self):
+        """The dashboard reports refreshed averages and totals"""
+        collector = MetricsCollector()
+        collector.track_operation_end("fast", "1", 10.0)
+        collector.track_operation_end("fast", "2", 20.0, success=False)
+        collector.track_operation_end("slow", "3", 100.0)
+
+        performance = collector.get_performance_dashboard()["performance"]
+        assert performance["total_executions"] == 3
+        assert performance["total_successes"] == 2
+        assert performance["top_operations"][0] == ("fast", 2)
+        assert performance["operation_stats"]["fast"]["avg_duration_ms"] == 15.0
+        assert performance["operation_stats"]["fast"]["success_rate"] == 0.5
+
+    def test_time_series_recorded_per_metric(self):
+        """Operation timings land in the metric's time series"""
+        collector = MetricsCollector()
+        collector.track_operation_end("op", "1", 5.0)
+        collector.track_operation_end("op", "2", 7.0)
+
+        timestamps, values = collector.get_time_series("operation_duration_ms", MetricType.TIMER)
+        assert values == [5.0, 7.0]
+        assert timestamps == sorted(timestamps)
+
+    def test_reset_metrics(self):
+        """Resetting clears stats and time series"""
+        collector = MetricsCollector()
+        collector.track_operation_end("op", "1", 5.0)
+        collector.reset_metrics()
+
+        assert collector.get_performance_stats() == {}
+        assert collector.get_time_series("operation_duration_ms", MetricType.TIMER) == ([], [])
@@ -0,0 +1,39 @@
+"""Tests for the real-time progress monitor and its console display"""
+
+import time
+from src.monitoring.real_time_monitor import RealTimeMonitor, ProgressDisplayManager
+
+class TestRealTimeMonitor:
+    """Test operation tracking"""
+    
+    def test_completed_operations_expire_without_monitor_thread(self):
+        """Finished operations drop out of the getters after their retention period"""
+        monitor = RealTimeMonitor()
+        monitor.completed_retention_seconds = 0.05
+        
+        monitor.start_operation("a", "llm_chat")
+        monitor.start_operation("b", "llm_chat")
+        monitor.complete_operation("b")
+        assert "b" in monitor.get_active_operations()
+        
+        time.sleep(0.1)
+        assert "b" not in monitor.get_active_operations()
+        assert monitor.get_operation_status("b") is None
+        assert monitor.get_operation_status("a") is not None
+
+class TestProgressDisplayManager:
+    """Test console progress output"""
+    
+    def test_throttled_update_is_flushed(self, capsys):
+        """A line held back by the throttle is written once the window closes"""
+        monitor = RealTimeMonitor()
+        display = ProgressDisplayManager(monitor)
+        
+        monitor.start_operation("op", "llm_chat")
+        monitor.update_operation("op", progress_percent=50.0, current_step="Halfway")
+        monitor.update_operation("op", progress_percent=60.0, current_step="Almost done")
+        time.sleep(display.flush_interval * 3)
+        
+        output = capsys.readouterr().out
+        assert "Almost done" in output
+        assert "Halfway" not in output  # coalesced into the newer line
@@ -0,0 +1,80 @@
+"""Tests for the task service's workflow templates and batch task creation"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+# Skip collection early when the CrewAI stack isn't installed
+pytest.importorskip("crewai")
+
+from src.services.task_service import TaskService
+
+@pytest.fixture
+def service(monkeypatch):
+    """Task service that builds lightweight stand-ins instead of CrewAI tasks"""
+    monkeypatch.setattr("src.services.task_service.Task", MagicMock(side_effect=lambda **kwargs: MagicMock(**kwargs)))
+    return TaskService()
+
+@pytest.fixture
+def agents():
+    """Four placeholder agents: tech lead, developer, reviewer, manager"""
+    return [MagicMock(name=role) for role in ("tech_lead", "developer", "reviewer", "manager")]
+
+class TestWorkflowTemplates:
+    """Test the shared workflow templates"""
+
+    def test_templates_are_shared_between_services(self):
+        """Every service reads the same prebuilt templates"""
+        first, second = TaskService(), TaskService()
+        assert first.get_workflow_template("code_review") is second.get_workflow_template("code_review")
+        assert first.get_available_workflows() == (
+            "agile_development", "code_review", "research_development", "performance_optimization"
+        )
+        assert first.get_workflow_template("missing") is None
+
+class TestTaskCreation:
+    """Test batch task creation and bookkeeping"""
+
+    def test_development_workflow_ids_and_counts(self, service, agents):
+        """Tasks get sequential IDs and are counted by type and priority"""
+        tasks = service.create_development_workflow(agents, project_type="api")
+
+        assert [task.agent for task in tasks] == agents
+        assert list(service.get_task_specifications()) == [
+            "design_0", "development_1", "review_2", "planning_3"
+        ]
+        summary = service.get_workflow_summary()
+        assert summary["total_tasks"] == 4
+        assert summary["task_type_distribution"] == {
+            "design": 1, "development": 1, "review": 1, "planning": 1
+        }
+        assert summary["priority_distribution"] == {"high": 3, "medium": 1}
+
+    def test_ids_continue_across_batches(self, service, agents):
+        """A later batch numbers its tasks after the earlier ones"""
+        service.create_analysis_workflow(agents, "codebase")
+        service.create_task_from_spec(service.get_workflow_template("code_review")[0], agents[0])
+
+        assert list(service.get_task_specifications()) == ["analysis_0", "review_1", "analysis_2"]
+
+    def test_get_all_tasks_view_is_rebuilt_after_changes(self, service, agents):
+        """The read-only task tuple is reused until new tasks are created"""
+        service.create_analysis_workflow(agents, "codebase")
+        view = service.get_all_tasks()
+
+        assert isinstance(view, tuple)
+        assert service.get_all_tasks() is view
+        assert service.get_all_tasks(copy=True) == list(view)
+
+        service.create_testing_workflow(agents, "unit tests")
+        assert len(service.get_all_tasks()) == 5
+
+    def test_reset(self, service, agents):
+        """Resetting clears tasks, IDs and counts"""
+        service.create_development_workflow(agents)
+        service.reset()
+
+        assert service.get_all_tasks() == ()
+        assert service.get_workflow_summary()["task_type_distribution"] == {}
+        service.create_analysis_workflow(agents, "codebase")
+        assert list(service.get_task_specifications()) == ["analysis_0", "review_1"]
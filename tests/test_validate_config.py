@@ -0,0 +1,89 @@
+"""Tests for the configuration validation script's syntax cache and bytecode writing"""
+
+import importlib.util
+import json
+import sys
+
+import pytest
+
+import validate_config
+
+def _new_run():
+    """Forget what this run stat'd and read, as a fresh process would"""
+    validate_config._cached_read_bytes.cache_clear()
+    validate_config._syntax_cache_key.cache_clear()
+
+@pytest.fixture(autouse=True)
+def _fresh_run(tmp_path, monkeypatch):
+    """Give each test its own cache file and empty per-run memos"""
+    monkeypatch.setattr(validate_config, "SYNTAX_CACHE_PATH", str(tmp_path / ".validate_cache.json"))
+    _new_run()
+    validate_config._valid_digests.clear()
+    yield
+    _new_run()
+    validate_config._valid_digests.clear()
+
+class TestSyntaxCache:
+    """Test the on-disk cache of successful parses"""
+
+    def test_cache_round_trip(self, tmp_path):
+        """Saved results load back when the bytecode magic matches"""
+        validate_config._save_syntax_cache({"a.py": [1, 2, True]})
+        assert validate_config._load_syntax_cache() == {"a.py": [1, 2, True]}
+
+    def test_cache_from_another_python_is_ignored(self):
+        """A cache written under a different magic number is discarded"""
+        with open(validate_config.SYNTAX_CACHE_PATH, "w") as f:
+            json.dump({"magic": "00000000", "files": {"a.py": [1, 2, True]}}, f)
+        assert validate_config._load_syntax_cache() == {}
+
+    def test_unchanged_files_are_not_recompiled(self, tmp_path, monkeypatch):
+        """Only files changed since their last successful parse are checked again"""
+        source = tmp_path / "module.py"
+        source.write_text("x = 1\n")
+        cache, out = {}, []
+        assert validate_config.validate_python_files([str(source)], out, cache)
+
+        checked = []
+        real_check = validate_config._check_syntax
+        monkeypatch.setattr(validate_config, "_check_syntax", lambda path: checked.append(path) or real_check(path))
+
+        _new_run()
+        assert validate_config.validate_python_files([str(source)], out, cache)
+        assert checked == []
+
+        source.write_text("x = 12\n")
+        _new_run()
+        assert validate_config.validate_python_files([str(source)], out, cache)
+        assert checked == [str(source)]
+
+    def test_syntax_errors_are_reported_and_not_cached(self, tmp_path):
+        """A failing file is reported even in quiet mode and stays out of the cache"""
+        source = tmp_path / "broken.py"
+        source.write_text("def broken(:\n")
+        cache, out = {}, []
+
+        assert not validate_config.validate_python_files([str(source)], out, cache, verbose=False)
+        assert len(out) == 1 and "Syntax error" in out[0]
+        assert str(source) not in cache
+
+class TestBytecode:
+    """Test .pyc writing during the syntax check"""
+
+    def test_pyc_written_when_bytecode_enabled(self, tmp_path, monkeypatch):
+        """The check leaves an importable .pyc behind"""
+        monkeypatch.setattr(sys, "dont_write_bytecode", False)
+        source = tmp_path / "compiled.py"
+        source.write_text("y = 2\n")
+
+        assert validate_config.validate_python_syntax(str(source))
+        assert (tmp_path / importlib.util.cache_from_source(source.name)).exists()
+
+    def test_no_pyc_when_bytecode_disabled(self, tmp_path, monkeypatch):
+        """PYTHONDONTWRITEBYTECODE is respected"""
+        monkeypatch.setattr(sys, "dont_write_bytecode", True)
+        source = tmp_path / "plain.py"
+        source.write_text("z = 3\n")
+
+        assert validate_config.validate_python_syntax(str(source))
+        assert not (tmp_path / "__pycache__").exists()